@@ -44,6 +44,11 @@ history = []
 lock = threading.Lock()
 shutdown_event = threading.Event()
 
+# Stream support: bumped under the lock for every new reading so SSE
+# clients can sleep until something actually changes
+reading_seq = 0
+reading_cond = threading.Condition(lock)
+
 # IRDS integration
 gesture_modifier = GestureModifier() if IRDS_AVAILABLE else None
 irds_output_file = Path(__file__).parent.parent.parent / "data" / "irds_feedback.json"
@@ -172,7 +177,7 @@ def save_irds_feedback(irds: dict):
 
 def process_frame(frame: np.ndarray, calibrate: bool = False) -> tuple:
     """Process a frame and return reading + annotated frame."""
-    global current_reading, is_calibrated, history
+    global current_reading, is_calibrated, history, reading_seq
     
     if not is_running or shutdown_event.is_set():
         return None, frame
@@ -191,6 +196,8 @@ def process_frame(frame: np.ndarray, calibrate: bool = False) -> tuple:
             history.append(current_reading)
             if len(history) > 100:
                 history.pop(0)
+        reading_seq += 1
+        reading_cond.notify_all()
     
     return reading, annotated
 
@@ -394,6 +401,34 @@ def get_current_reading():
     return jsonify({'face_detected': False, 'pain_score': 0, 'level': 'NONE'})
 
 
+@app.route('/api/stream')
+def stream_readings():
+    """
+    Push readings to clients as Server-Sent Events.
+
+    One event per new reading: consumers sleep between frames instead
+    of polling /api/reading and discarding duplicates. A comment line
+    is emitted every second while idle to keep the connection alive.
+    """
+    def generate():
+        last_seq = 0
+        while not shutdown_event.is_set():
+            with reading_cond:
+                if reading_seq == last_seq:
+                    reading_cond.wait(timeout=1.0)
+                if reading_seq == last_seq:
+                    payload = None
+                else:
+                    last_seq = reading_seq
+                    payload = json.dumps(current_reading)
+            if payload is None:
+                yield ": keepalive\n\n"
+            else:
+                yield f"data: {payload}\n\n"
+
+    return Response(generate(), mimetype='text/event-stream')
+
+
 @app.route('/api/history')
 def get_history():
     """Get pain reading history."""
@@ -413,6 +448,29 @@ def get_status():
     })
 
 
+@app.route('/api/combined')
+def get_combined():
+    """
+    Get status and current reading in a single response.
+
+    Pollers previously hit /api/status and /api/reading back to back
+    every tick; this halves their request count (and the lock traffic
+    that goes with it).
+    """
+    with lock:
+        reading = current_reading
+    return jsonify({
+        'status': {
+            'is_running': is_running,
+            'is_calibrated': is_calibrated,
+            'source_type': 'camera' if (video_source and video_source.is_camera) else 'file',
+            'frame_count': video_source.current_frame if video_source else 0,
+            'progress': video_source.progress if video_source else 0
+        },
+        'reading': reading if reading else {'face_detected': False, 'pain_score': 0, 'level': 'NONE'}
+    })
+
+
 @app.route('/api/irds')
 def get_irds_feedback():
     """Get current IRDS gesture modifiers."""
@@ -15,8 +15,12 @@ Usage in IRDS:
     4. Apply modifiers to gesture speed, amplitude, and force
 """
 
+import io
+import sys
 import json
 import time
+import socket
+import selectors
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Dict, Callable
@@ -37,6 +41,17 @@ class GestureModifiers:
     confidence: float = 0.0
 
 
+# Feedback field names and defaults, in GestureModifiers field order.
+# Kept as module-level tuples so _update_modifiers can fill all nine
+# fields in a single pass instead of nine separate .get() statements.
+_MODIFIER_KEYS = (
+    'speed_modifier', 'amplitude_modifier', 'force_modifier',
+    'should_pause', 'should_stop', 'pain_level', 'pain_score',
+    'timestamp', 'confidence'
+)
+_MODIFIER_DEFAULTS = (1.0, 1.0, 1.0, False, False, 0, 0.0, None, 0.0)
+
+
 class FeedbackConsumer:
     """
     Consume pain feedback for IRDS gesture adjustment.
@@ -61,7 +76,17 @@ class FeedbackConsumer:
                 force=base_force * modifiers.force_modifier
             )
     """
-    
+
+    # Conservative defaults returned while feedback data is stale.
+    # Built once and shared - callers must treat it as read-only.
+    _STALE_DEFAULT_MODIFIERS = GestureModifiers(
+        speed_modifier=0.5,
+        amplitude_modifier=0.5,
+        force_modifier=0.5,
+        should_pause=True,
+        confidence=0.0
+    )
+
     def __init__(
         self,
         feedback_file: str = None,
@@ -87,8 +112,31 @@ class FeedbackConsumer:
         self._lock = threading.Lock()
         self._running = False
         self._thread = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._socket: Optional[socket.socket] = None
+        self._wakeup_recv: Optional[socket.socket] = None
+        self._wakeup_send: Optional[socket.socket] = None
         self._last_update = 0
+        self._expires_at = 0.0
         self._last_file_mtime = 0
+
+        # Bumped on every update; lets read paths cheaply detect change
+        self._modifiers_version = 0
+        self._adj_cache_key = None
+        self._adj_cache_value = None
+
+        # Reusable receive buffer so the UDP path does not allocate a
+        # fresh bytes object per datagram
+        self._recv_buf = bytearray(4096)
+
+        # SPSC history ring for post-hoc analysis: _update_modifiers is
+        # the only writer (advances head), drain_history the only reader
+        # (advances tail), so no lock is needed - each index store is
+        # atomic under the GIL. Size must be a power of two.
+        self._history_size = 64
+        self._history = [None] * self._history_size
+        self._history_head = 0
+        self._history_tail = 0
         
         # Callback for pain events
         self._on_high_pain: Optional[Callable] = None
@@ -103,37 +151,94 @@ class FeedbackConsumer:
         self._on_critical_pain = callback
     
     def start(self):
-        """Start polling for feedback data."""
+        """
+        Start listening for feedback data.
+
+        A single selector-based event loop services both the UDP socket
+        and the feedback file poll, so one consumer costs one thread even
+        when both sources are configured.
+        """
         self._running = True
-        
-        if self.feedback_file:
-            self._thread = threading.Thread(target=self._poll_file, daemon=True)
-        elif self.socket_port:
-            self._thread = threading.Thread(target=self._listen_socket, daemon=True)
-        
-        if self._thread:
+        self._selector = selectors.DefaultSelector()
+
+        # Self-pipe used to wake the selector for immediate shutdown
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_recv.setblocking(False)
+        self._selector.register(
+            self._wakeup_recv, selectors.EVENT_READ, self._drain_wakeup
+        )
+
+        if self.socket_port:
+            self._init_socket()
+
+        if self.feedback_file or self.socket_port:
+            self._thread = threading.Thread(target=self._run_loop, daemon=True)
             self._thread.start()
             print(f"Feedback consumer started")
-    
+
     def stop(self):
-        """Stop polling."""
+        """Stop the event loop."""
         self._running = False
+        if self._wakeup_send:
+            try:
+                self._wakeup_send.send(b'\x00')
+            except OSError:
+                pass
         if self._thread:
             self._thread.join(timeout=2.0)
-    
-    def _poll_file(self):
-        """Poll JSON file for updates."""
+
+    def _init_socket(self):
+        """Create the UDP socket and register it with the selector."""
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind(('0.0.0.0', self.socket_port))
+        self._socket.setblocking(False)
+        self._selector.register(self._socket, selectors.EVENT_READ, self._drain_udp)
+        print(f"Listening for feedback on port {self.socket_port}")
+
+    def _run_loop(self):
+        """Selector event loop servicing all feedback sources."""
+        # When polling a file, wake periodically to check its mtime;
+        # socket-only consumers block until a datagram arrives
+        timeout = 0.05 if self.feedback_file else None
+
         while self._running:
-            try:
-                if self.feedback_file and self.feedback_file.exists():
-                    mtime = self.feedback_file.stat().st_mtime
-                    if mtime > self._last_file_mtime:
-                        self._last_file_mtime = mtime
-                        self._read_feedback_file()
-            except Exception as e:
-                pass
-            time.sleep(0.05)  # 50ms polling interval
-    
+            events = self._selector.select(timeout=timeout)
+            for key, _ in events:
+                key.data()
+            if self.feedback_file:
+                self._check_file()
+
+        self._close_loop_resources()
+
+    def _close_loop_resources(self):
+        """Close sockets and selector owned by the event loop."""
+        if self._socket:
+            self._selector.unregister(self._socket)
+            self._socket.close()
+            self._socket = None
+        self._selector.unregister(self._wakeup_recv)
+        self._wakeup_recv.close()
+        self._wakeup_send.close()
+        self._selector.close()
+
+    def _drain_wakeup(self):
+        """Consume shutdown wake-up bytes from the self-pipe."""
+        try:
+            self._wakeup_recv.recv(64)
+        except BlockingIOError:
+            pass
+
+    def _check_file(self):
+        """Check the feedback file for updates."""
+        try:
+            if self.feedback_file.exists():
+                mtime = self.feedback_file.stat().st_mtime
+                if mtime > self._last_file_mtime:
+                    self._last_file_mtime = mtime
+                    self._read_feedback_file()
+        except Exception as e:
+            pass
+
     def _read_feedback_file(self):
         """Read and parse feedback file."""
         try:
@@ -142,46 +247,44 @@ class FeedbackConsumer:
             self._update_modifiers(data)
         except Exception as e:
             pass
-    
-    def _listen_socket(self):
-        """Listen for UDP socket messages."""
-        import socket
-        
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.bind(('0.0.0.0', self.socket_port))
-        sock.settimeout(1.0)
-        
-        print(f"Listening for feedback on port {self.socket_port}")
-        
-        while self._running:
+
+    def _drain_udp(self):
+        """Drain all pending datagrams from the non-blocking UDP socket."""
+        while True:
             try:
-                data, addr = sock.recvfrom(4096)
-                feedback = json.loads(data.decode('utf-8'))
-                self._update_modifiers(feedback)
-            except socket.timeout:
+                nbytes, addr = self._socket.recvfrom_into(self._recv_buf)
+            except (BlockingIOError, OSError):
+                break
+            try:
+                feedback = json.loads(self._recv_buf[:nbytes])
+            except ValueError:
                 continue
-            except Exception as e:
-                pass
-        
-        sock.close()
+            self._update_modifiers(feedback)
     
     def _update_modifiers(self, data: dict):
         """Update modifiers from feedback data."""
+        get = data.get
+        speed, amp, force, pause, stop, lvl, score, ts, conf = (
+            get(k, d) for k, d in zip(_MODIFIER_KEYS, _MODIFIER_DEFAULTS)
+        )
+        if ts is None:
+            ts = time.time()
+
         with self._lock:
             old_level = self._modifiers.pain_level
-            
+
             self._modifiers = GestureModifiers(
-                speed_modifier=data.get('speed_modifier', 1.0),
-                amplitude_modifier=data.get('amplitude_modifier', 1.0),
-                force_modifier=data.get('force_modifier', 1.0),
-                should_pause=data.get('should_pause', False),
-                should_stop=data.get('should_stop', False),
-                pain_level=data.get('pain_level', 0),
-                pain_score=data.get('pain_score', 0.0),
-                timestamp=data.get('timestamp', time.time()),
-                confidence=data.get('confidence', 0.0)
+                speed, amp, force, pause, stop, lvl, score, ts, conf
             )
-            self._last_update = time.time()
+            self._last_update = time.monotonic()
+            self._expires_at = self._last_update + self.stale_threshold
+            self._modifiers_version += 1
+
+            # Record into the history ring; write the slot first, then
+            # publish by advancing the head
+            head = self._history_head
+            self._history[head & (self._history_size - 1)] = self._modifiers
+            self._history_head = head + 1
             
             # Trigger callbacks for pain level changes
             new_level = self._modifiers.pain_level
@@ -200,19 +303,12 @@ class FeedbackConsumer:
             returns safe conservative defaults.
         """
         with self._lock:
-            # Check if data is stale
-            if self._last_update > 0:
-                age = time.time() - self._last_update
-                if age > self.stale_threshold:
-                    if self.default_on_missing:
-                        # Return conservative defaults for stale data
-                        return GestureModifiers(
-                            speed_modifier=0.5,
-                            amplitude_modifier=0.5,
-                            force_modifier=0.5,
-                            should_pause=True,
-                            confidence=0.0
-                        )
+            # Check if data is stale (expiry precomputed in _update_modifiers
+            # so the read path is a single compare, no subtraction)
+            if self._last_update > 0 and time.monotonic() >= self._expires_at:
+                if self.default_on_missing:
+                    # Return shared conservative defaults for stale data
+                    return self._STALE_DEFAULT_MODIFIERS
             
             # Return current modifiers or defaults
             if self._last_update == 0 and self.default_on_missing:
@@ -230,11 +326,63 @@ class FeedbackConsumer:
                 confidence=self._modifiers.confidence
             )
     
+    def drain_history(self) -> list:
+        """
+        Drain recorded modifiers for logging or post-hoc analysis.
+
+        Single-consumer: call from at most one audit/logger thread.
+        Draining never blocks _update_modifiers - the producer only
+        advances the head and this method only advances the tail.
+        Entries older than the ring size are overwritten and lost.
+
+        Returns:
+            List of GestureModifiers in arrival order
+        """
+        drained = []
+        mask = self._history_size - 1
+        head = self._history_head
+        tail = self._history_tail
+
+        # Skip anything the producer has already overwritten
+        if head - tail > self._history_size:
+            tail = head - self._history_size
+
+        while tail != head:
+            drained.append(self._history[tail & mask])
+            tail += 1
+
+        self._history_tail = tail
+        return drained
+
+    def _snapshot(self) -> GestureModifiers:
+        """
+        Return the current modifiers without copying.
+
+        The modifiers object is replaced wholesale on each update, so
+        reading the reference without the lock is safe under the GIL.
+        Callers must treat the returned object as read-only.
+        """
+        if self._last_update > 0 and time.monotonic() >= self._expires_at:
+            if self.default_on_missing:
+                return self._STALE_DEFAULT_MODIFIERS
+        return self._modifiers
+
+    def peek_safety(self) -> tuple:
+        """
+        Get (should_stop, should_pause) without allocating.
+
+        Intended for the per-tick emergency-stop check in the gesture
+        loop, where constructing a full GestureModifiers copy per call
+        would be wasted work.
+        """
+        m = self._snapshot()
+        return (m.should_stop, m.should_pause)
+
     def is_safe_to_proceed(self) -> bool:
         """Check if it's safe to continue gesture execution."""
-        modifiers = self.get_modifiers()
-        return not modifiers.should_stop and not modifiers.should_pause
-    
+        stop, pause = self.peek_safety()
+        return not stop and not pause
+
     def get_adjusted_params(
         self,
         base_speed: float,
@@ -243,23 +391,38 @@ class FeedbackConsumer:
     ) -> Dict[str, float]:
         """
         Get adjusted gesture parameters.
-        
+
         Args:
             base_speed: Base gesture speed
             base_amplitude: Base gesture amplitude
             base_force: Base gesture force
-            
+
         Returns:
-            Dictionary with adjusted speed, amplitude, force
+            Dictionary with adjusted speed, amplitude, force.
+            The dictionary is cached between calls with unchanged inputs
+            and must be treated as read-only.
         """
-        modifiers = self.get_modifiers()
-        
-        return {
-            'speed': base_speed * modifiers.speed_modifier,
-            'amplitude': base_amplitude * modifiers.amplitude_modifier,
-            'force': base_force * modifiers.force_modifier,
-            'is_safe': not modifiers.should_stop and not modifiers.should_pause
+        m = self._snapshot()
+
+        # Gesture loops tick far faster than pain state changes; reuse
+        # the last result when the bases and modifiers are unchanged
+        key = (
+            base_speed, base_amplitude, base_force,
+            self._modifiers_version,
+            m is self._STALE_DEFAULT_MODIFIERS
+        )
+        if key == self._adj_cache_key:
+            return self._adj_cache_value
+
+        value = {
+            'speed': base_speed * m.speed_modifier,
+            'amplitude': base_amplitude * m.amplitude_modifier,
+            'force': base_force * m.force_modifier,
+            'is_safe': not m.should_stop and not m.should_pause
         }
+        self._adj_cache_key = key
+        self._adj_cache_value = value
+        return value
 
 
 def demo_consumer():
@@ -305,24 +468,32 @@ def demo_consumer():
     
     for i in range(10):
         modifiers = consumer.get_modifiers()
-        
-        print(f"\n--- Gesture Step {i+1} ---")
-        print(f"Pain Level: {modifiers.pain_level} (Score: {modifiers.pain_score:.1f}%)")
-        
+
+        # Batch the status lines into one stdout write per tick so the
+        # loop (the template users copy into real IRDS loops) does a
+        # single syscall instead of one per print
+        buf = io.StringIO()
+        w = buf.write
+
+        w(f"\n--- Gesture Step {i+1} ---\n")
+        w(f"Pain Level: {modifiers.pain_level} (Score: {modifiers.pain_score:.1f}%)\n")
+
         if modifiers.should_stop:
-            print("❌ STOP: Emergency stop triggered!")
+            w("❌ STOP: Emergency stop triggered!\n")
+            sys.stdout.write(buf.getvalue())
             break
         elif modifiers.should_pause:
-            print("⏸️  PAUSE: Gesture paused due to high pain")
+            w("⏸️  PAUSE: Gesture paused due to high pain\n")
         else:
             adjusted = consumer.get_adjusted_params(
                 base_speed, base_amplitude, base_force
             )
-            print(f"✓ Executing with:")
-            print(f"  Speed: {adjusted['speed']:.2f}")
-            print(f"  Amplitude: {adjusted['amplitude']:.2f}")
-            print(f"  Force: {adjusted['force']:.2f}")
-        
+            w("✓ Executing with:\n")
+            w(f"  Speed: {adjusted['speed']:.2f}\n")
+            w(f"  Amplitude: {adjusted['amplitude']:.2f}\n")
+            w(f"  Force: {adjusted['force']:.2f}\n")
+
+        sys.stdout.write(buf.getvalue())
         time.sleep(0.5)
     
     consumer.stop()
@@ -332,93 +503,14 @@ def demo_consumer():
     print("=" * 60)
 
 
-# Code snippet for IRDS integration
-IRDS_INTEGRATION_SNIPPET = '''
-# =====================================================
-# IRDS Integration Code Snippet
-# =====================================================
-# Copy this code to your IRDS project to consume pain feedback
-
-from pathlib import Path
-import json
-import time
-import threading
-from dataclasses import dataclass
-from typing import Dict
-
-@dataclass
-class GestureModifiers:
-    speed_modifier: float = 1.0
-    amplitude_modifier: float = 1.0
-    force_modifier: float = 1.0
-    should_pause: bool = False
-    should_stop: bool = False
-    pain_level: int = 0
-    pain_score: float = 0.0
-
-class PainFeedbackReader:
-    """Simple reader for pain feedback file."""
-    
-    def __init__(self, feedback_file: str):
-        self.feedback_file = Path(feedback_file)
-        self._modifiers = GestureModifiers()
-        self._lock = threading.Lock()
-        self._running = False
-        self._thread = None
-        self._last_mtime = 0
-    
-    def start(self):
-        self._running = True
-        self._thread = threading.Thread(target=self._poll, daemon=True)
-        self._thread.start()
-    
-    def stop(self):
-        self._running = False
-    
-    def _poll(self):
-        while self._running:
-            try:
-                if self.feedback_file.exists():
-                    mtime = self.feedback_file.stat().st_mtime
-                    if mtime > self._last_mtime:
-                        self._last_mtime = mtime
-                        with open(self.feedback_file) as f:
-                            data = json.load(f)
-                        with self._lock:
-                            self._modifiers = GestureModifiers(
-                                speed_modifier=data.get('speed_modifier', 1.0),
-                                amplitude_modifier=data.get('amplitude_modifier', 1.0),
-                                force_modifier=data.get('force_modifier', 1.0),
-                                should_pause=data.get('should_pause', False),
-                                should_stop=data.get('should_stop', False),
-                                pain_level=data.get('pain_level', 0),
-                                pain_score=data.get('pain_score', 0.0)
-                            )
-            except:
-                pass
-            time.sleep(0.05)
-    
-    def get_modifiers(self) -> GestureModifiers:
-        with self._lock:
-            return self._modifiers
-
-# Usage in IRDS gesture execution:
-# 
-# feedback = PainFeedbackReader('/path/to/feedback/data/irds_feedback.json')
-# feedback.start()
-#
-# # In your gesture loop:
-# mods = feedback.get_modifiers()
-# if mods.should_stop:
-#     emergency_stop()
-# elif mods.should_pause:
-#     pause()
-# else:
-#     execute_gesture(
-#         speed=base_speed * mods.speed_modifier,
-#         amplitude=base_amplitude * mods.amplitude_modifier
-#     )
-'''
+# Code snippet for IRDS integration lives in irds_snippet.txt and is
+# loaded on demand so importing this module does not retain it in memory
+def _read_resource(name: str) -> str:
+    """Load a text resource bundled with the integration package."""
+    # Resolve relative to this file: importlib.resources needs the
+    # 'integration' package importable, which isn't the case when this
+    # module runs as a script (sys.path[0] is the integration/ dir)
+    return (Path(__file__).parent / name).read_text(encoding='utf-8')
 
 
 def print_integration_guide():
@@ -426,65 +518,11 @@ def print_integration_guide():
     print("=" * 60)
     print("IRDS Integration Guide")
     print("=" * 60)
-    print("""
-The feedback system outputs pain data in a JSON format that IRDS can
-consume to adjust gesture parameters in real-time.
-
-ARCHITECTURE:
-                                    
-┌─────────────────┐    ┌─────────────────┐    ┌─────────────────┐
-│  Piezo Sensor   │───▶│                 │    │                 │
-│    Arduino      │    │   Feedback      │───▶│     IRDS        │
-└─────────────────┘    │   Bridge        │    │   Gesture       │
-                       │                 │    │   Model         │
-┌─────────────────┐    │   (irds_bridge) │    │                 │
-│  Face Detection │───▶│                 │    └─────────────────┘
-│    Camera       │    └─────────────────┘            │
-└─────────────────┘             │                     │
-                                │                     ▼
-                                ▼              ┌─────────────────┐
-                       ┌─────────────────┐     │  Robotic Arm    │
-                       │  JSON File or   │     │  Gesture        │
-                       │  UDP Socket     │     │  Execution      │
-                       └─────────────────┘     └─────────────────┘
-
-DATA FLOW:
-1. Pain sensors (piezo/face) detect pain levels
-2. Feedback bridge converts to gesture modifiers
-3. IRDS reads modifiers from file or socket
-4. Gesture execution adjusts speed/amplitude/force
-
-FEEDBACK JSON FORMAT:
-{
-    "timestamp": 1734355200.123,
-    "pain_level": 2,              // 0=NONE, 1=LIGHT, 2=MODERATE, 3=HIGH, 4=CRITICAL
-    "pain_level_name": "MODERATE",
-    "pain_score": 45.5,           // 0-100 percentage
-    "source": "fused",            // 'piezo', 'face', or 'fused'
-    "confidence": 0.85,           // 0-1 confidence
-    "speed_modifier": 0.5,        // Multiply gesture speed by this
-    "amplitude_modifier": 0.7,    // Multiply amplitude by this
-    "force_modifier": 0.6,        // Multiply force by this
-    "should_pause": false,        // True = pause gesture execution
-    "should_stop": false          // True = emergency stop
-}
-
-QUICK START:
-1. Start feedback bridge:
-   cd /home/nishant/project/feedback
-   python integration/irds_bridge.py --demo
-
-2. In IRDS, read the feedback file:
-   feedback_file = '/home/nishant/project/feedback/data/irds_feedback.json'
-
-3. Apply modifiers to gesture execution (see code snippet below)
-""")
-    print(IRDS_INTEGRATION_SNIPPET)
+    print(_read_resource('irds_guide.txt'))
+    print(_read_resource('irds_snippet.txt'))
 
 
 if __name__ == '__main__':
-    import sys
-    
     if len(sys.argv) > 1 and sys.argv[1] == '--guide':
         print_integration_guide()
     else:
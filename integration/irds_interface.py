@@ -10,16 +10,218 @@ This interface can be used in multiple ways:
 4. REST API: HTTP endpoints for distributed systems
 """
 
+import os
+import sys
 import json
 import time
 import threading
 import socket
-from dataclasses import dataclass, asdict
+import struct
+from collections import deque
+from multiprocessing import shared_memory
+from dataclasses import dataclass
+from itertools import islice
 from typing import Optional, Callable, Dict, Any, List
 from pathlib import Path
 from enum import Enum
 import queue
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional - stdlib json is the fallback
+    orjson = None
+
+try:
+    import numba
+except ImportError:
+    # numba is optional - the scalar cores below run fine uncompiled
+    numba = None
+
+try:
+    import msgspec
+    _msgpack_encoder = msgspec.msgpack.Encoder()
+    _msgpack_decoder = msgspec.msgpack.Decoder()
+except ImportError:
+    # msgspec is optional - only the msgpack feedback encoding needs it
+    msgspec = None
+    _msgpack_encoder = None
+    _msgpack_decoder = None
+
+
+# Bound once at import: skips the time-module attribute lookup on the
+# per-sample feedback paths
+_now = time.time
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _loads(data):
+    """Parse JSON from str or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = bytes(data)
+    return json.loads(data)
+
+
+def _make_sendmmsg():
+    """
+    Build a sendmmsg() wrapper via ctypes.
+
+    Linux-only: lets the publisher flush a batch of UDP datagrams with a
+    single syscall. Returns None when unavailable, in which case callers
+    fall back to one send() per message.
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+
+    import ctypes
+    import ctypes.util
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        libc.sendmmsg
+    except (AttributeError, OSError, TypeError):
+        return None
+
+    class IoVec(ctypes.Structure):
+        _fields_ = [
+            ('iov_base', ctypes.c_void_p),
+            ('iov_len', ctypes.c_size_t),
+        ]
+
+    class MsgHdr(ctypes.Structure):
+        _fields_ = [
+            ('msg_name', ctypes.c_void_p),
+            ('msg_namelen', ctypes.c_uint),
+            ('msg_iov', ctypes.POINTER(IoVec)),
+            ('msg_iovlen', ctypes.c_size_t),
+            ('msg_control', ctypes.c_void_p),
+            ('msg_controllen', ctypes.c_size_t),
+            ('msg_flags', ctypes.c_int),
+        ]
+
+    class MMsgHdr(ctypes.Structure):
+        _fields_ = [
+            ('msg_hdr', MsgHdr),
+            ('msg_len', ctypes.c_uint),
+        ]
+
+    def sendmmsg(fd: int, payloads: list) -> int:
+        """Send all payloads (bytes) on a connected socket in one syscall."""
+        n = len(payloads)
+        bufs = [ctypes.create_string_buffer(p, len(p)) for p in payloads]
+        iovecs = (IoVec * n)()
+        msgs = (MMsgHdr * n)()
+        for i in range(n):
+            iovecs[i].iov_base = ctypes.cast(bufs[i], ctypes.c_void_p)
+            iovecs[i].iov_len = len(payloads[i])
+            msgs[i].msg_hdr.msg_iov = ctypes.pointer(iovecs[i])
+            msgs[i].msg_hdr.msg_iovlen = 1
+        sent = libc.sendmmsg(fd, msgs, n, 0)
+        if sent < 0:
+            raise OSError(ctypes.get_errno(), 'sendmmsg failed')
+        return sent
+
+    return sendmmsg
+
+
+_sendmmsg = _make_sendmmsg()
+
+
+def feedback_file_path(project_root) -> Path:
+    """
+    Resolve the shared feedback file location.
+
+    Defaults to <project_root>/data/irds_feedback.json. Setting
+    RAMDISK=1 moves it to /dev/shm (Linux tmpfs) so the multi-Hz
+    write/rename loop becomes a memory copy with no disk traffic.
+    Producers and consumers both resolve through this helper so they
+    agree on the location.
+    """
+    if os.environ.get('RAMDISK') == '1' and Path('/dev/shm').is_dir():
+        return Path('/dev/shm/irds_feedback.json')
+    return Path(project_root) / "data" / "irds_feedback.json"
+
+
+def _inotify_watch(directory: str):
+    """
+    Create an inotify fd watching a directory for completed writes.
+
+    Linux-only; returns a non-blocking fd whose readability signals that
+    a file in the directory was close-written, moved in, or created.
+    Returns None when inotify is unavailable, in which case callers fall
+    back to mtime polling.
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+
+    import ctypes
+    import ctypes.util
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        libc.inotify_init1
+    except (AttributeError, OSError, TypeError):
+        return None
+
+    IN_NONBLOCK = 0x800
+    IN_CLOEXEC = 0x80000
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+
+    fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+    if fd < 0:
+        return None
+
+    mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+    wd = libc.inotify_add_watch(fd, directory.encode(), mask)
+    if wd < 0:
+        os.close(fd)
+        return None
+
+    return fd
+
+
+# Level names indexed by pain level (0-4)
+_LEVEL_NAMES = ('NONE', 'LIGHT', 'MODERATE', 'HIGH', 'CRITICAL')
+
+
+def _modifier_core(speed: float, amplitude: float, force: float,
+                   pain_score: float):
+    """
+    Scalar arithmetic core shared by get_modifiers and create_feedback.
+
+    Kept free of object allocation so numba can JIT-compile it when
+    installed; without numba it still saves nothing to inline it back,
+    as the call overhead is one frame.
+    """
+    score_factor = 1.0 - (pain_score % 20) / 100  # 0.8-1.0 adjustment
+    return speed * score_factor, amplitude * score_factor, force * score_factor
+
+
+if numba is not None:
+    _modifier_core = numba.njit(cache=True, fastmath=True)(_modifier_core)
+
+
+# Printf-style JSON template for the fixed PainFeedback shape: filling
+# it is substantially faster than running a general JSON encoder when
+# there is no details payload to serialize
+_FEEDBACK_TEMPLATE = (
+    b'{"timestamp":%.6f,"pain_level":%d,"pain_level_name":"%s",'
+    b'"pain_score":%.2f,"source":"%s","confidence":%.3f,'
+    b'"speed_modifier":%.3f,"amplitude_modifier":%.3f,'
+    b'"force_modifier":%.3f,"should_pause":%s,"should_stop":%s,'
+    b'"details":null}'
+)
+
 
 class PainLevel(Enum):
     """Pain levels matching both piezo and face detection modules."""
@@ -67,23 +269,75 @@ class PainFeedback:
     details: Optional[Dict[str, Any]] = None
     
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        data = asdict(self)
-        return data
+        """
+        Convert to dictionary for JSON serialization.
+
+        Shallow copy: the ``details`` dict is shared with this object,
+        so callers must not mutate it.
+        """
+        return self.__dict__.copy()
     
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
-    
+        return self.to_json_bytes().decode('utf-8')
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact JSON bytes for socket sends and file writes."""
+        if self.details is None:
+            # Fixed-shape fast path: fill the precompiled template
+            # instead of walking a dict through the JSON encoder
+            return _FEEDBACK_TEMPLATE % (
+                self.timestamp,
+                self.pain_level,
+                self.pain_level_name.encode('utf-8'),
+                self.pain_score,
+                self.source.encode('utf-8'),
+                self.confidence,
+                self.speed_modifier,
+                self.amplitude_modifier,
+                self.force_modifier,
+                b'true' if self.should_pause else b'false',
+                b'true' if self.should_stop else b'false'
+            )
+        return _dumps(self.to_dict())
+
+    def to_msgpack(self) -> bytes:
+        """
+        Encode as a fixed-order msgpack tuple - roughly 3x smaller than
+        the JSON form because field names are not repeated per message.
+        Requires the optional msgspec package; both ends of a transport
+        must agree on the field order (see from_msgpack).
+        """
+        if _msgpack_encoder is None:
+            raise RuntimeError(
+                "msgpack encoding requires msgspec (pip install msgspec)"
+            )
+        return _msgpack_encoder.encode((
+            self.timestamp, self.pain_level, self.pain_level_name,
+            self.pain_score, self.source, self.confidence,
+            self.speed_modifier, self.amplitude_modifier,
+            self.force_modifier, self.should_pause, self.should_stop,
+            self.details
+        ))
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> 'PainFeedback':
+        """Decode the fixed-order msgpack tuple from to_msgpack."""
+        if _msgpack_decoder is None:
+            raise RuntimeError(
+                "msgpack decoding requires msgspec (pip install msgspec)"
+            )
+        return cls(*_msgpack_decoder.decode(data))
+
     @classmethod
     def from_dict(cls, data: dict) -> 'PainFeedback':
         """Create from dictionary."""
         return cls(**data)
-    
+
     @classmethod
-    def from_json(cls, json_str: str) -> 'PainFeedback':
-        """Create from JSON string."""
-        return cls.from_dict(json.loads(json_str))
+    def from_json(cls, json_str) -> 'PainFeedback':
+        """Create from a JSON string or bytes."""
+        return cls.from_dict(_loads(json_str))
 
 
 class GestureModifier:
@@ -136,6 +390,19 @@ class GestureModifier:
         self.speed_map = speed_map or self.DEFAULT_SPEED_MAP.copy()
         self.amplitude_map = amplitude_map or self.DEFAULT_AMPLITUDE_MAP.copy()
         self.force_map = force_map or self.DEFAULT_FORCE_MAP.copy()
+
+        # Flat lookup table indexed by clamped int level: one tuple index
+        # replaces an enum construction and three dict lookups per sample
+        self._table = tuple(
+            (
+                self.speed_map.get(level, 1.0),
+                self.amplitude_map.get(level, 1.0),
+                self.force_map.get(level, 1.0),
+                level == PainLevel.HIGH,
+                level == PainLevel.CRITICAL
+            )
+            for level in PainLevel
+        )
     
     def get_modifiers(
         self,
@@ -154,23 +421,20 @@ class GestureModifier:
         Returns:
             Dictionary with speed, amplitude, and force modifiers
         """
-        level = PainLevel(min(4, max(0, pain_level)))
-        
-        # Get base modifiers from maps
-        speed = self.speed_map.get(level, 1.0)
-        amplitude = self.amplitude_map.get(level, 1.0)
-        force = self.force_map.get(level, 1.0)
-        
+        lvl = 0 if pain_level < 0 else 4 if pain_level > 4 else pain_level
+        speed, amplitude, force, pause, stop = self._table[lvl]
+
         # Fine-tune based on pain score within level
         # Higher pain score within a level = slightly lower modifiers
-        score_factor = 1.0 - (pain_score % 20) / 100  # 0.8-1.0 adjustment
-        
+        speed, amplitude, force = _modifier_core(speed, amplitude, force,
+                                                 pain_score)
+
         return {
-            'speed_modifier': speed * score_factor,
-            'amplitude_modifier': amplitude * score_factor,
-            'force_modifier': force * score_factor,
-            'should_pause': level == PainLevel.HIGH,
-            'should_stop': level == PainLevel.CRITICAL
+            'speed_modifier': speed,
+            'amplitude_modifier': amplitude,
+            'force_modifier': force,
+            'should_pause': pause,
+            'should_stop': stop
         }
     
     def create_feedback(
@@ -196,20 +460,25 @@ class GestureModifier:
         Returns:
             Complete PainFeedback object
         """
-        modifiers = self.get_modifiers(pain_level, pain_score, source)
-        
+        # Inline the table lookup rather than going through get_modifiers,
+        # so no intermediate modifier dict is built on the hot path
+        lvl = 0 if pain_level < 0 else 4 if pain_level > 4 else pain_level
+        speed, amplitude, force, pause, stop = self._table[lvl]
+        speed, amplitude, force = _modifier_core(speed, amplitude, force,
+                                                 pain_score)
+
         return PainFeedback(
-            timestamp=time.time(),
+            timestamp=_now(),
             pain_level=pain_level,
             pain_level_name=pain_level_name,
             pain_score=pain_score,
             source=source,
             confidence=confidence,
-            speed_modifier=modifiers['speed_modifier'],
-            amplitude_modifier=modifiers['amplitude_modifier'],
-            force_modifier=modifiers['force_modifier'],
-            should_pause=modifiers['should_pause'],
-            should_stop=modifiers['should_stop'],
+            speed_modifier=speed,
+            amplitude_modifier=amplitude,
+            force_modifier=force,
+            should_pause=pause,
+            should_stop=stop,
             details=details
         )
 
@@ -229,39 +498,93 @@ class FeedbackPublisher:
         output_file: Optional[str] = None,
         socket_host: Optional[str] = None,
         socket_port: int = 5555,
-        use_udp: bool = True
+        use_udp: bool = True,
+        socket_path: Optional[str] = None,
+        batch_socket_sends: bool = False,
+        heartbeat_s: float = 1.0
     ):
         """
         Initialize feedback publisher.
-        
+
         Args:
             output_file: Path to output JSON file (updated on each publish)
             socket_host: Host for socket communication
             socket_port: Port for socket communication
             use_udp: Use UDP (True) or TCP (False) for socket
+            socket_path: Unix domain socket path; when set, takes
+                precedence over socket_host/socket_port (lower latency
+                for same-host IRDS coupling)
+            batch_socket_sends: Queue datagram sends on a background
+                thread and flush bursts with a single sendmmsg() syscall
+                on Linux (UDP/UDS only)
+            heartbeat_s: Re-publish interval for unchanged feedback;
+                duplicates inside this window skip file/socket/callback
+                outputs (history is always recorded)
         """
         self.output_file = Path(output_file) if output_file else None
         self.socket_host = socket_host
         self.socket_port = socket_port
         self.use_udp = use_udp
-        
+        self.socket_path = socket_path
+
         self._socket = None
         self._callbacks: List[Callable[[PainFeedback], None]] = []
-        self._history: List[PainFeedback] = []
+        # Immutable snapshot iterated by publish: rebuilding it on
+        # add/remove keeps dispatch free of both the lock and the
+        # mutation checks list iteration performs
+        self._callbacks_t: tuple = ()
         self._max_history = 100
+        # deque(maxlen=...) evicts the oldest entry in O(1); a list's
+        # pop(0) shifts every remaining element on each publish
+        self._history: deque = deque(maxlen=self._max_history)
+        # Latest feedback kept as a plain attribute: reference swaps are
+        # atomic under the GIL, so readers never need the lock
+        self._latest: Optional[PainFeedback] = None
         self._lock = threading.Lock()
-        
-        # Initialize socket if host specified
-        if socket_host:
+        self._send_queue: Optional[queue.Queue] = None
+        self._sender_thread: Optional[threading.Thread] = None
+        self._last_history_write = 0.0
+        self.heartbeat_s = heartbeat_s
+        self._last_pub_key = None
+        self._last_pub_time = 0.0
+
+        # Initialize socket if a destination is specified
+        if socket_host or socket_path:
             self._init_socket()
-    
+
+        # Batched sends only make sense for datagram transports
+        if (batch_socket_sends and self._socket is not None
+                and (self.use_udp or self.socket_path)):
+            self._send_queue = queue.Queue()
+            self._sender_thread = threading.Thread(
+                target=self._sender_loop, daemon=True
+            )
+            self._sender_thread.start()
+
     def _init_socket(self):
         """Initialize socket connection."""
         try:
+            if self.socket_path:
+                # Unix domain datagram socket - skips the loopback
+                # network stack entirely for same-host consumers
+                self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                self._socket.connect(self.socket_path)
+                print(f"Socket initialized: {self.socket_path} (UDS)")
+                return
             if self.use_udp:
                 self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                # Connect the UDP socket once so each publish can use
+                # send() and skip the per-call address lookup
+                self._socket.connect((self.socket_host, self.socket_port))
             else:
                 self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                # Feedbacks are small and latency-sensitive: disable
+                # Nagle so each publish goes on the wire immediately,
+                # and keep the send buffer small so backpressure from a
+                # stalled consumer surfaces quickly instead of queueing
+                # seconds of stale feedback
+                self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 8192)
                 self._socket.connect((self.socket_host, self.socket_port))
             print(f"Socket initialized: {self.socket_host}:{self.socket_port} ({'UDP' if self.use_udp else 'TCP'})")
         except Exception as e:
@@ -270,36 +593,60 @@ class FeedbackPublisher:
     
     def add_callback(self, callback: Callable[[PainFeedback], None]):
         """Add callback function for feedback events."""
-        self._callbacks.append(callback)
-    
+        with self._lock:
+            self._callbacks.append(callback)
+            self._callbacks_t = tuple(self._callbacks)
+
     def remove_callback(self, callback: Callable[[PainFeedback], None]):
         """Remove callback function."""
-        if callback in self._callbacks:
-            self._callbacks.remove(callback)
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+                self._callbacks_t = tuple(self._callbacks)
     
     def publish(self, feedback: PainFeedback):
         """
         Publish pain feedback to all outputs.
-        
+
+        Consecutive feedbacks that carry the same effective state are
+        suppressed: sensors sample far faster than pain changes, so most
+        publishes would rewrite the file and resend identical bytes.
+        An unchanged state is still re-published every heartbeat_s so
+        consumers can tell "no change" from "publisher died".
+
         Args:
             feedback: PainFeedback object to publish
         """
+        self._latest = feedback
         with self._lock:
-            # Store in history
+            # Store in history (deque drops the oldest automatically)
             self._history.append(feedback)
-            if len(self._history) > self._max_history:
-                self._history.pop(0)
-        
+
+        now = _now()
+        key = (
+            feedback.pain_level,
+            round(feedback.pain_score, 1),
+            feedback.should_pause,
+            feedback.should_stop
+        )
+        if key == self._last_pub_key and now - self._last_pub_time < self.heartbeat_s:
+            return
+        self._last_pub_key = key
+        self._last_pub_time = now
+
         # Write to file
         if self.output_file:
             self._write_to_file(feedback)
         
-        # Send via socket
-        if self._socket:
+        # Send via socket (queued when batching is enabled)
+        if self._send_queue is not None:
+            self._send_queue.put(feedback)
+        elif self._socket:
             self._send_socket(feedback)
         
-        # Call callbacks
-        for callback in self._callbacks:
+        # Call callbacks (tuple snapshot: concurrent add/remove swaps in
+        # a new tuple instead of mutating the one being iterated)
+        for callback in self._callbacks_t:
             try:
                 callback(feedback)
             except Exception as e:
@@ -311,44 +658,92 @@ class FeedbackPublisher:
             # Ensure directory exists
             self.output_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # Write current feedback
-            with open(self.output_file, 'w') as f:
-                f.write(feedback.to_json())
-            
-            # Also write history
-            history_file = self.output_file.with_suffix('.history.json')
-            with open(history_file, 'w') as f:
-                history_data = [fb.to_dict() for fb in self._history[-20:]]
-                json.dump(history_data, f, indent=2)
+            # Write current feedback to a temp file and rename atomically
+            # so mtime-polling readers never see a partial file
+            tmp_file = self.output_file.with_suffix('.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(feedback.to_json_bytes())
+            os.replace(tmp_file, self.output_file)
+
+            # History is throttled to ~1 write/sec instead of every
+            # sample (kept indented for human inspection)
+            now = _now()
+            if now - self._last_history_write > 1.0:
+                self._last_history_write = now
+                history_file = self.output_file.with_suffix('.history.json')
+                with open(history_file, 'w') as f:
+                    start = len(self._history) - 20
+                    history_data = [
+                        fb.to_dict()
+                        for fb in islice(self._history, max(start, 0), None)
+                    ]
+                    json.dump(history_data, f, indent=2)
                 
         except Exception as e:
             print(f"File write error: {e}")
     
     def _send_socket(self, feedback: PainFeedback):
-        """Send feedback via socket."""
+        """Send feedback via socket (single allocation per send)."""
         try:
-            data = feedback.to_json().encode('utf-8')
-            
-            if self.use_udp:
-                self._socket.sendto(data, (self.socket_host, self.socket_port))
+            # Both transports are connected at init, so a plain send()
+            # works for UDP and TCP alike. to_json_bytes() produces the
+            # payload directly as bytes - no intermediate str, no
+            # encode() copy - and send() consumes it by reference.
+            self._socket.send(feedback.to_json_bytes())
+        except Exception as e:
+            print(f"Socket send error: {e}")
+
+    # Maximum datagrams flushed per sendmmsg batch
+    _MAX_SEND_BATCH = 64
+
+    def _sender_loop(self):
+        """Drain queued feedbacks and flush them in batches."""
+        while True:
+            feedback = self._send_queue.get()
+            if feedback is None:
+                return
+
+            batch = [feedback.to_json_bytes()]
+            while len(batch) < self._MAX_SEND_BATCH:
+                try:
+                    nxt = self._send_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    self._flush_batch(batch)
+                    return
+                batch.append(nxt.to_json_bytes())
+
+            self._flush_batch(batch)
+
+    def _flush_batch(self, payloads: list):
+        """Send a batch of serialized feedbacks, one syscall if possible."""
+        try:
+            if len(payloads) > 1 and _sendmmsg is not None:
+                _sendmmsg(self._socket.fileno(), payloads)
             else:
-                self._socket.send(data)
-                
+                for data in payloads:
+                    self._socket.send(data)
         except Exception as e:
             print(f"Socket send error: {e}")
     
     def get_latest(self) -> Optional[PainFeedback]:
-        """Get the most recent feedback."""
-        with self._lock:
-            return self._history[-1] if self._history else None
+        """Get the most recent feedback (lock-free)."""
+        return self._latest
     
     def get_history(self, count: int = 10) -> List[PainFeedback]:
         """Get recent feedback history."""
         with self._lock:
-            return self._history[-count:]
+            start = len(self._history) - count
+            return list(islice(self._history, max(start, 0), None))
     
     def close(self):
         """Close socket connection."""
+        if self._sender_thread:
+            # Sentinel drains the queue and stops the sender
+            self._send_queue.put(None)
+            self._sender_thread.join(timeout=2.0)
+            self._sender_thread = None
         if self._socket:
             self._socket.close()
             self._socket = None
@@ -365,21 +760,25 @@ class FeedbackSubscriber:
         input_file: Optional[str] = None,
         socket_host: str = '0.0.0.0',
         socket_port: int = 5555,
-        use_udp: bool = True
+        use_udp: bool = True,
+        socket_path: Optional[str] = None
     ):
         """
         Initialize feedback subscriber.
-        
+
         Args:
             input_file: Path to input JSON file to poll
             socket_host: Host to listen on for socket
             socket_port: Port to listen on
             use_udp: Use UDP (True) or TCP (False)
+            socket_path: Unix domain socket path to listen on; takes
+                precedence over socket_host/socket_port
         """
         self.input_file = Path(input_file) if input_file else None
         self.socket_host = socket_host
         self.socket_port = socket_port
         self.use_udp = use_udp
+        self.socket_path = socket_path
         
         self._socket = None
         self._running = False
@@ -387,6 +786,9 @@ class FeedbackSubscriber:
         self._callback: Optional[Callable[[PainFeedback], None]] = None
         self._last_feedback: Optional[PainFeedback] = None
         self._last_file_mtime = 0
+
+        # Reusable receive buffer: avoids a bytes allocation per datagram
+        self._recv_buf = bytearray(8192)
     
     def start(self, callback: Callable[[PainFeedback], None]):
         """
@@ -410,6 +812,17 @@ class FeedbackSubscriber:
     
     def _init_socket(self):
         """Initialize listening socket."""
+        if self.socket_path:
+            # Remove a stale socket file from a previous run
+            path = Path(self.socket_path)
+            if path.exists():
+                path.unlink()
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            self._socket.bind(self.socket_path)
+            self._socket.settimeout(1.0)
+            print(f"Listening on {self.socket_path}")
+            return
+
         if self.use_udp:
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         else:
@@ -425,36 +838,63 @@ class FeedbackSubscriber:
         print(f"Listening on {self.socket_host}:{self.socket_port}")
     
     def _poll_file(self):
-        """Poll file for updates."""
+        """Wait for file updates (inotify when available, else polling)."""
+        fd = _inotify_watch(str(self.input_file.parent))
+        if fd is None:
+            self._poll_file_fallback()
+            return
+
+        import select
+
+        try:
+            while self._running:
+                self._check_input_file()
+                # Sleep until the directory changes; the timeout only
+                # bounds how long stop() can take to be noticed
+                readable, _, _ = select.select([fd], [], [], 0.5)
+                if readable:
+                    try:
+                        os.read(fd, 4096)  # drain queued events
+                    except BlockingIOError:
+                        pass
+        finally:
+            os.close(fd)
+
+    def _poll_file_fallback(self):
+        """Poll file for updates (non-Linux fallback)."""
         while self._running:
-            try:
-                if self.input_file.exists():
-                    mtime = self.input_file.stat().st_mtime
-                    if mtime > self._last_file_mtime:
-                        self._last_file_mtime = mtime
-                        with open(self.input_file, 'r') as f:
-                            data = f.read()
-                        feedback = PainFeedback.from_json(data)
-                        self._last_feedback = feedback
-                        if self._callback:
-                            self._callback(feedback)
-            except Exception as e:
-                pass  # Ignore file read errors
-            
+            self._check_input_file()
             time.sleep(0.1)  # Poll every 100ms
+
+    def _check_input_file(self):
+        """Read the input file if its mtime advanced."""
+        try:
+            if self.input_file.exists():
+                mtime = self.input_file.stat().st_mtime
+                if mtime > self._last_file_mtime:
+                    self._last_file_mtime = mtime
+                    with open(self.input_file, 'rb') as f:
+                        data = f.read()
+                    feedback = PainFeedback.from_json(data)
+                    self._last_feedback = feedback
+                    if self._callback:
+                        self._callback(feedback)
+        except Exception as e:
+            pass  # Ignore file read errors
     
     def _listen_socket(self):
         """Listen for socket messages."""
         while self._running:
             try:
                 if self.use_udp:
-                    data, addr = self._socket.recvfrom(4096)
+                    nbytes, addr = self._socket.recvfrom_into(self._recv_buf)
+                    data = memoryview(self._recv_buf)[:nbytes]
                 else:
                     conn, addr = self._socket.accept()
                     data = conn.recv(4096)
                     conn.close()
                 
-                feedback = PainFeedback.from_json(data.decode('utf-8'))
+                feedback = PainFeedback.from_json(data)
                 self._last_feedback = feedback
                 if self._callback:
                     self._callback(feedback)
@@ -472,53 +912,191 @@ class FeedbackSubscriber:
             self._thread.join(timeout=2.0)
         if self._socket:
             self._socket.close()
+        if self.socket_path:
+            try:
+                Path(self.socket_path).unlink()
+            except OSError:
+                pass
     
     def get_latest(self) -> Optional[PainFeedback]:
         """Get the most recent feedback."""
         return self._last_feedback
 
 
+class SharedMemoryPublisher:
+    """
+    Publish pain feedback through a shared-memory slot.
+
+    Lowest-latency same-host transport: the publisher packs the feedback
+    into a fixed struct in a multiprocessing.SharedMemory segment and
+    consumers read it without any syscall, copy or JSON parse.
+
+    Consistency uses a seqlock: a version counter before the payload is
+    bumped to an odd value before writing and back to even after, so a
+    reader that sees an odd or changed version simply retries.
+    """
+
+    # timestamp, pain_level, pain_level_name, source,
+    # pain_score, confidence, speed, amplitude, force, pause, stop
+    _STRUCT = struct.Struct('<di32s16sfffff??')
+    _VERSION = struct.Struct('<I')
+
+    def __init__(self, name: str = 'irds_feedback'):
+        """
+        Initialize shared memory publisher.
+
+        Args:
+            name: Shared memory segment name (subscribers use the same)
+        """
+        self.name = name
+        size = self._VERSION.size + self._STRUCT.size
+        try:
+            self._shm = shared_memory.SharedMemory(
+                name=name, create=True, size=size
+            )
+        except FileExistsError:
+            # Reuse a segment left over from a previous run
+            self._shm = shared_memory.SharedMemory(name=name)
+        self._version = 0
+        self._VERSION.pack_into(self._shm.buf, 0, 0)
+
+    def publish(self, feedback: PainFeedback):
+        """Write feedback into the shared slot (wait-free for readers)."""
+        buf = self._shm.buf
+        # Odd version marks the write in progress
+        self._version += 1
+        self._VERSION.pack_into(buf, 0, self._version & 0xFFFFFFFF)
+        self._STRUCT.pack_into(
+            buf, self._VERSION.size,
+            feedback.timestamp,
+            feedback.pain_level,
+            feedback.pain_level_name.encode('utf-8')[:32],
+            feedback.source.encode('utf-8')[:16],
+            feedback.pain_score,
+            feedback.confidence,
+            feedback.speed_modifier,
+            feedback.amplitude_modifier,
+            feedback.force_modifier,
+            feedback.should_pause,
+            feedback.should_stop
+        )
+        # Even version publishes the completed write
+        self._version += 1
+        self._VERSION.pack_into(buf, 0, self._version & 0xFFFFFFFF)
+
+    def close(self, unlink: bool = True):
+        """Close the segment (and remove it when unlink is True)."""
+        self._shm.close()
+        if unlink:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class SharedMemorySubscriber:
+    """
+    Read pain feedback from a SharedMemoryPublisher slot.
+
+    get_latest() is a pure memory read - no syscalls, no parsing - and
+    is safe to call from the IRDS control loop at any rate.
+    """
+
+    _STRUCT = SharedMemoryPublisher._STRUCT
+    _VERSION = SharedMemoryPublisher._VERSION
+
+    def __init__(self, name: str = 'irds_feedback'):
+        """
+        Initialize shared memory subscriber.
+
+        Args:
+            name: Shared memory segment name used by the publisher
+        """
+        self.name = name
+        self._shm = shared_memory.SharedMemory(name=name)
+
+    def get_latest(self) -> Optional[PainFeedback]:
+        """Get the most recent feedback, or None if nothing published."""
+        buf = self._shm.buf
+        unpack_version = self._VERSION.unpack_from
+        for _ in range(8):
+            v1 = unpack_version(buf, 0)[0]
+            if v1 == 0:
+                return None  # nothing published yet
+            if v1 & 1:
+                continue  # write in progress, retry
+            fields = self._STRUCT.unpack_from(buf, self._VERSION.size)
+            if unpack_version(buf, 0)[0] != v1:
+                continue  # torn read, retry
+            (timestamp, pain_level, name, source, pain_score, confidence,
+             speed, amplitude, force, pause, stop) = fields
+            return PainFeedback(
+                timestamp=timestamp,
+                pain_level=pain_level,
+                pain_level_name=name.rstrip(b'\x00').decode('utf-8'),
+                pain_score=pain_score,
+                source=source.rstrip(b'\x00').decode('utf-8'),
+                confidence=confidence,
+                speed_modifier=speed,
+                amplitude_modifier=amplitude,
+                force_modifier=force,
+                should_pause=pause,
+                should_stop=stop
+            )
+        return None
+
+    def close(self):
+        """Close the segment (publisher owns unlinking)."""
+        self._shm.close()
+
+
 def create_feedback_server(
     output_file: str = None,
-    socket_port: int = 5555
+    socket_port: int = 5555,
+    socket_path: str = None
 ) -> FeedbackPublisher:
     """
     Create a feedback server for publishing pain data.
-    
+
     Args:
         output_file: Path to output JSON file
         socket_port: Port for UDP socket
-        
+        socket_path: Unix domain socket path (preferred for same-host IRDS)
+
     Returns:
         Configured FeedbackPublisher
     """
     return FeedbackPublisher(
         output_file=output_file,
-        socket_host='localhost',
+        socket_host=None if socket_path else 'localhost',
         socket_port=socket_port,
-        use_udp=True
+        use_udp=True,
+        socket_path=socket_path
     )
 
 
 def create_feedback_client(
     input_file: str = None,
-    socket_port: int = 5555
+    socket_port: int = 5555,
+    socket_path: str = None
 ) -> FeedbackSubscriber:
     """
     Create a feedback client for receiving pain data.
     For use by IRDS or other systems.
-    
+
     Args:
         input_file: Path to input JSON file to poll
         socket_port: Port to listen on
-        
+        socket_path: Unix domain socket path (preferred for same-host IRDS)
+
     Returns:
         Configured FeedbackSubscriber
     """
     return FeedbackSubscriber(
         input_file=input_file,
         socket_port=socket_port,
-        use_udp=True
+        use_udp=True,
+        socket_path=socket_path
     )
 
 
@@ -608,76 +1186,90 @@ def fuse_feedback(
     piezo_feedback: Optional[PainFeedback],
     face_feedback: Optional[PainFeedback],
     piezo_weight: float = 0.6,
-    face_weight: float = 0.4
+    face_weight: float = 0.4,
+    include_details: bool = True
 ) -> PainFeedback:
     """
     Fuse feedback from multiple sources.
-    
+
     Uses weighted combination of piezo and face feedback to create
     a unified pain assessment.
-    
+
     Args:
         piezo_feedback: Feedback from piezo sensor
         face_feedback: Feedback from face detector
         piezo_weight: Weight for piezo feedback (0-1)
         face_weight: Weight for face feedback (0-1)
-        
+        include_details: Attach the per-source details dict; hot callers
+            that never read it can pass False to skip building it
+
     Returns:
         Fused PainFeedback object
     """
-    modifier = GestureModifier()
-    
     # Handle missing sources
     if piezo_feedback is None and face_feedback is None:
-        return modifier.create_feedback(
+        return GestureModifier().create_feedback(
             pain_level=0,
             pain_level_name='NONE',
             pain_score=0.0,
             source='fused',
             confidence=0.0
         )
-    
+
     if piezo_feedback is None:
         face_feedback.source = 'fused'
         return face_feedback
-    
+
     if face_feedback is None:
         piezo_feedback.source = 'fused'
         return piezo_feedback
-    
+
+    # Read every field once into locals so the fusion below is pure
+    # local-variable arithmetic with no attribute lookups
+    p_score = piezo_feedback.pain_score
+    p_level = piezo_feedback.pain_level
+    p_conf = piezo_feedback.confidence
+    p_speed = piezo_feedback.speed_modifier
+    p_amp = piezo_feedback.amplitude_modifier
+    p_force = piezo_feedback.force_modifier
+    f_score = face_feedback.pain_score
+    f_level = face_feedback.pain_level
+    f_conf = face_feedback.confidence
+    f_speed = face_feedback.speed_modifier
+    f_amp = face_feedback.amplitude_modifier
+    f_force = face_feedback.force_modifier
+
     # Weighted fusion
-    total_weight = piezo_weight + face_weight
-    piezo_w = piezo_weight / total_weight
-    face_w = face_weight / total_weight
-    
+    piezo_w = piezo_weight / (piezo_weight + face_weight)
+    face_w = 1.0 - piezo_w
+
     # Fuse pain score
-    fused_score = (
-        piezo_feedback.pain_score * piezo_w * piezo_feedback.confidence +
-        face_feedback.pain_score * face_w * face_feedback.confidence
-    )
-    
-    # Determine fused level (take max for safety)
-    fused_level = max(piezo_feedback.pain_level, face_feedback.pain_level)
-    
-    # Fuse modifiers (take minimum for safety)
-    fused_speed = min(piezo_feedback.speed_modifier, face_feedback.speed_modifier)
-    fused_amplitude = min(piezo_feedback.amplitude_modifier, face_feedback.amplitude_modifier)
-    fused_force = min(piezo_feedback.force_modifier, face_feedback.force_modifier)
-    
+    fused_score = p_score * piezo_w * p_conf + f_score * face_w * f_conf
+
+    # Level: take max for safety; modifiers: take min for safety.
+    # Conditionals beat built-in max/min on two args (no tuple build).
+    fused_level = p_level if p_level > f_level else f_level
+    fused_speed = p_speed if p_speed < f_speed else f_speed
+    fused_amplitude = p_amp if p_amp < f_amp else f_amp
+    fused_force = p_force if p_force < f_force else f_force
+
     # Fuse confidence
-    fused_confidence = (
-        piezo_feedback.confidence * piezo_w +
-        face_feedback.confidence * face_w
-    )
-    
-    # Level name from max level
-    level_names = ['NONE', 'LIGHT', 'MODERATE', 'HIGH', 'CRITICAL']
-    fused_level_name = level_names[min(fused_level, 4)]
-    
+    fused_confidence = p_conf * piezo_w + f_conf * face_w
+
+    if include_details:
+        details = {
+            'piezo': piezo_feedback.details,
+            'face': face_feedback.details,
+            'weights': {'piezo': piezo_w, 'face': face_w}
+        }
+    else:
+        details = None
+
+    # fused_level is the max of two in-range levels, so no clamp needed
     return PainFeedback(
-        timestamp=time.time(),
+        timestamp=_now(),
         pain_level=fused_level,
-        pain_level_name=fused_level_name,
+        pain_level_name=_LEVEL_NAMES[fused_level],
         pain_score=fused_score,
         source='fused',
         confidence=fused_confidence,
@@ -686,11 +1278,7 @@ def fuse_feedback(
         force_modifier=fused_force,
         should_pause=piezo_feedback.should_pause or face_feedback.should_pause,
         should_stop=piezo_feedback.should_stop or face_feedback.should_stop,
-        details={
-            'piezo': piezo_feedback.details,
-            'face': face_feedback.details,
-            'weights': {'piezo': piezo_w, 'face': face_w}
-        }
+        details=details
     )
 
 
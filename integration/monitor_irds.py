@@ -8,21 +8,27 @@ how the gesture modifiers change in real-time.
 Usage:
     # Step 1: Start face detection in another terminal
     python face_detection/start.py
-    
+
     # Step 2: In browser, select YouTube and enter a URL
-    
+
     # Step 3: Run this monitor
     python integration/monitor_irds.py
 """
 
 import sys
 import time
-import json
+import select
+import os
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from integration.irds_interface import _loads, _inotify_watch, feedback_file_path
+
+
 def main():
-    feedback_file = Path(__file__).parent.parent / "data" / "irds_feedback.json"
-    
+    feedback_file = feedback_file_path(Path(__file__).parent.parent)
+
     print("=" * 60)
     print("  IRDS Feedback Monitor")
     print("=" * 60)
@@ -35,20 +41,26 @@ def main():
     print("\n   Or run: python integration/irds_bridge.py --demo")
     print("\nPress Ctrl+C to stop\n")
     print("=" * 60)
-    
+
     last_mtime = 0
     emojis = ["😊 NONE", "😐 LIGHT", "😣 MODERATE", "😖 HIGH", "😫 CRITICAL"]
-    
+
+    # Sleep on inotify when the kernel supports it: updates wake us
+    # immediately instead of on the next 200ms poll tick
+    feedback_file.parent.mkdir(parents=True, exist_ok=True)
+    inotify_fd = _inotify_watch(str(feedback_file.parent))
+    write = sys.stdout.write
+
     try:
         while True:
             if feedback_file.exists():
                 mtime = feedback_file.stat().st_mtime
                 if mtime > last_mtime:
                     last_mtime = mtime
-                    
-                    with open(feedback_file) as f:
-                        data = json.load(f)
-                    
+
+                    with open(feedback_file, 'rb') as f:
+                        data = _loads(f.read())
+
                     level = data.get('pain_level', 0)
                     score = data.get('pain_score', 0)
                     speed = data.get('speed_modifier', 1.0)
@@ -56,24 +68,34 @@ def main():
                     force = data.get('force_modifier', 1.0)
                     pause = data.get('should_pause', False)
                     stop = data.get('should_stop', False)
-                    
-                    # Clear line and print
+
+                    # Build the whole status line and emit it with a
+                    # single write so the terminal never shows a
+                    # half-drawn line
                     status = emojis[min(level, 4)]
-                    
-                    print(f"\r{status:15} | Score: {score:5.1f}% | "
-                          f"Speed: {speed:.0%} | Amp: {amp:.0%} | Force: {force:.0%}", end="")
-                    
+                    line = (f"\r{status:15} | Score: {score:5.1f}% | "
+                            f"Speed: {speed:.0%} | Amp: {amp:.0%} | Force: {force:.0%}")
+
                     if stop:
-                        print(" | 🛑 STOP!", end="")
+                        line += " | 🛑 STOP!"
                     elif pause:
-                        print(" | ⏸️ PAUSE", end="")
-                    
-                    print("          ", end="", flush=True)
-            
-            time.sleep(0.2)
-            
+                        line += " | ⏸️ PAUSE"
+
+                    write(line + "          ")
+                    sys.stdout.flush()
+
+            if inotify_fd is not None:
+                readable, _, _ = select.select([inotify_fd], [], [], 1.0)
+                if readable:
+                    os.read(inotify_fd, 4096)
+            else:
+                time.sleep(0.2)
+
     except KeyboardInterrupt:
         print("\n\n✓ Monitor stopped")
+    finally:
+        if inotify_fd is not None:
+            os.close(inotify_fd)
 
 
 if __name__ == '__main__':
@@ -19,6 +19,7 @@ import sys
 import os
 import time
 import json
+from collections import namedtuple
 from pathlib import Path
 
 # Setup path
@@ -28,44 +29,73 @@ sys.path.insert(0, str(project_root))
 from integration.irds_interface import GestureModifier, face_to_feedback, FeedbackPublisher
 
 
+# Flat reading record shared by every frame; defining it once at module
+# scope avoids rebuilding a class object (and its dict) per frame
+FaceReading = namedtuple('FaceReading', [
+    'pain_score', 'level', 'brow_furrow', 'eye_squeeze',
+    'nose_wrinkle', 'lip_raise', 'face_detected', 'frame_number'
+])
+
+_NO_FEATURES = {}
+
+
 def create_face_reading(result, frame_num):
-    """Create a reading object from detector result."""
-    class FaceReading:
-        def __init__(self, r, fn):
-            self.pain_score = r.get('pain_score', 0)
-            self.level = r.get('level', 'NONE')
-            self.brow_furrow = r.get('features', {}).get('brow_furrow', 0)
-            self.eye_squeeze = r.get('features', {}).get('eye_squeeze', 0)
-            self.nose_wrinkle = r.get('features', {}).get('nose_wrinkle', 0)
-            self.lip_raise = r.get('features', {}).get('lip_raise', 0)
-            self.face_detected = r.get('face_detected', False)
-            self.frame_number = fn
-    return FaceReading(result, frame_num)
+    """Create a reading record from detector result."""
+    features = result.get('features', _NO_FEATURES)
+    return FaceReading(
+        pain_score=result.get('pain_score', 0),
+        level=result.get('level', 'NONE'),
+        brow_furrow=features.get('brow_furrow', 0),
+        eye_squeeze=features.get('eye_squeeze', 0),
+        nose_wrinkle=features.get('nose_wrinkle', 0),
+        lip_raise=features.get('lip_raise', 0),
+        face_detected=result.get('face_detected', False),
+        frame_number=frame_num
+    )
+
+
+# Status styling precomputed per pain level: (emoji prefix, stop tag,
+# pause tag), each with colors baked in, so the per-frame path only
+# formats the numbers
+_RESET = "\033[0m"
+_STATUS_STYLES = tuple(
+    (f"{color}{emoji} ",
+     f" | {color}🛑 STOP!{_RESET}",
+     f" | {color}⏸️ PAUSE{_RESET}")
+    for emoji, color in zip(
+        ["😊", "😐", "😣", "😖", "😫"],
+        ["\033[92m", "\033[93m", "\033[93m", "\033[91m", "\033[91m"]
+    )
+)
+
+# Flush the status line every Nth frame rather than per frame; safety
+# flags force an immediate flush
+_FLUSH_EVERY = 4
+_status_frames = 0
 
 
 def print_status(feedback, frame):
     """Print current status."""
-    emojis = ["😊", "😐", "😣", "😖", "😫"]
-    emoji = emojis[min(feedback.pain_level, 4)]
-    
-    # Colors
-    colors = ["\033[92m", "\033[93m", "\033[93m", "\033[91m", "\033[91m"]
-    color = colors[min(feedback.pain_level, 4)]
-    reset = "\033[0m"
-    
-    status = f"{color}{emoji} {feedback.pain_level_name:10}{reset}"
-    
-    line = (f"Frame {frame:4d} | {status} | "
+    global _status_frames
+
+    prefix, stop_tag, pause_tag = _STATUS_STYLES[min(feedback.pain_level, 4)]
+
+    line = (f"\rFrame {frame:4d} | {prefix}{feedback.pain_level_name:10}{_RESET} | "
             f"Score: {feedback.pain_score:5.1f}% | "
             f"Speed: {feedback.speed_modifier:.0%} | "
             f"Amp: {feedback.amplitude_modifier:.0%}")
-    
+
+    urgent = feedback.should_stop or feedback.should_pause
     if feedback.should_stop:
-        line += f" | {color}🛑 STOP!{reset}"
+        line += stop_tag
     elif feedback.should_pause:
-        line += f" | {color}⏸️ PAUSE{reset}"
-    
-    print(f"\r{line}", end="", flush=True)
+        line += pause_tag
+
+    # Bytes write skips the text layer's locking and per-call encode
+    sys.stdout.buffer.write(line.encode())
+    _status_frames += 1
+    if urgent or _status_frames % _FLUSH_EVERY == 0:
+        sys.stdout.buffer.flush()
 
 
 def main():
@@ -79,6 +109,8 @@ def main():
     parser.add_argument('--file', type=str, help='Video file path')
     parser.add_argument('--max-frames', type=int, default=300,
                         help='Max frames to process (default: 300)')
+    parser.add_argument('--fps', type=float, default=20.0,
+                        help='Target processing rate (default: 20)')
     args = parser.parse_args()
     
     print("=" * 70)
@@ -133,7 +165,18 @@ def main():
     
     frame_count = 0
     start_time = time.time()
-    
+
+    # Publish every Kth frame: downstream consumers track state, not
+    # individual frames, so the batch only needs its freshest feedback.
+    # Safety-flag changes always publish immediately.
+    publish_every = 8
+    last_safety = (False, False)
+
+    # Deadline pacing: sleep only for whatever remains of this frame's
+    # slot, so slow detection no longer compounds with a fixed sleep
+    period = 1.0 / args.fps if args.fps > 0 else 0.0
+    next_tick = time.monotonic()
+
     try:
         while frame_count < args.max_frames:
             frame_info = video.read_frame()
@@ -150,14 +193,25 @@ def main():
             reading = create_face_reading(result, frame_count)
             feedback = face_to_feedback(reading, modifier)
             
-            # Publish
-            publisher.publish(feedback)
+            # Publish (coalesced)
+            safety = (feedback.should_pause, feedback.should_stop)
+            if frame_count % publish_every == 0 or safety != last_safety:
+                publisher.publish(feedback)
+                last_safety = safety
             
             # Print status
             print_status(feedback, frame_count)
-            
-            # Small delay
-            time.sleep(0.05)
+
+            # Pace to the target rate
+            if period:
+                next_tick += period
+                slack = next_tick - time.monotonic()
+                if slack > 0:
+                    time.sleep(slack)
+                else:
+                    # Detection overran the slot; rebase instead of
+                    # racing to catch up
+                    next_tick = time.monotonic()
             
     except KeyboardInterrupt:
         print("\n\n⏹️ Stopped by user")
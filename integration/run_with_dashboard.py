@@ -21,9 +21,11 @@ The script will poll the dashboard and publish IRDS feedback to:
     data/irds_feedback.json
 """
 
+import os
 import sys
 import time
 import json
+import hashlib
 import requests
 from pathlib import Path
 
@@ -31,18 +33,44 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from integration.irds_interface import GestureModifier, PainFeedback
+from integration.irds_interface import (
+    GestureModifier,
+    PainFeedback,
+    feedback_file_path
+)
 
 
 # Dashboard API configuration
 DASHBOARD_URL = "http://localhost:5001"
 POLL_INTERVAL = 0.2  # seconds
 
+# One keep-alive session for every dashboard request: plain
+# requests.get() opens and tears down a TCP connection per call, which
+# at poll rates means a handshake every 200ms. The pool only ever talks
+# to the one dashboard host; a couple of spare connections cover the
+# SSE stream plus status checks running concurrently.
+SESSION = requests.Session()
+SESSION.mount(DASHBOARD_URL, requests.adapters.HTTPAdapter(
+    pool_connections=1, pool_maxsize=4))
+
+# Map face detection levels to pain levels (module-level so the hot
+# conversion path doesn't rebuild the dict per reading)
+LEVEL_MAP = {
+    'NONE': 0,
+    'MILD': 1,
+    'MODERATE': 2,
+    'SEVERE': 3,
+    'EXTREME': 4
+}
+
+# Feature fields copied from a dashboard reading into feedback details
+DETAIL_KEYS = ('brow_furrow', 'eye_squeeze', 'nose_wrinkle', 'lip_raise')
+
 
 def get_dashboard_reading():
     """Get current reading from face detection dashboard."""
     try:
-        resp = requests.get(f"{DASHBOARD_URL}/api/reading", timeout=1)
+        resp = SESSION.get(f"{DASHBOARD_URL}/api/reading", timeout=1)
         if resp.status_code == 200:
             return resp.json()
     except requests.exceptions.RequestException:
@@ -53,7 +81,36 @@ def get_dashboard_reading():
 def get_dashboard_status():
     """Get dashboard status."""
     try:
-        resp = requests.get(f"{DASHBOARD_URL}/api/status", timeout=1)
+        resp = SESSION.get(f"{DASHBOARD_URL}/api/status", timeout=1)
+        if resp.status_code == 200:
+            return resp.json()
+    except requests.exceptions.RequestException:
+        return None
+    return None
+
+
+def reading_digest(reading: dict) -> bytes:
+    """
+    16-byte fingerprint of a reading for duplicate detection.
+
+    Comparing digests replaces the recursive dict == dict walk over
+    every key of every polled reading; only the digest of the previous
+    reading needs to stay alive, not the whole dict.
+    """
+    payload = json.dumps(reading, sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+
+def get_dashboard_combined():
+    """
+    Get status and reading from the combined endpoint in one request.
+
+    Returns the {'status': ..., 'reading': ...} dict, or None if the
+    dashboard is unreachable or too old to serve /api/combined (the
+    caller then falls back to the two legacy endpoints).
+    """
+    try:
+        resp = SESSION.get(f"{DASHBOARD_URL}/api/combined", timeout=1)
         if resp.status_code == 200:
             return resp.json()
     except requests.exceptions.RequestException:
@@ -61,34 +118,59 @@ def get_dashboard_status():
     return None
 
 
+def stream_dashboard_readings():
+    """
+    Yield readings pushed by the dashboard's SSE stream.
+
+    Each new reading arrives as a `data: {json}` event the moment the
+    dashboard produces it - no polling, no duplicate filtering. Returns
+    without yielding when the endpoint is unavailable (older dashboard),
+    in which case the caller falls back to polling.
+    """
+    try:
+        resp = SESSION.get(f"{DASHBOARD_URL}/api/stream", stream=True,
+                            timeout=(1, None))
+    except requests.exceptions.RequestException:
+        return
+    if resp.status_code != 200:
+        resp.close()
+        return
+
+    try:
+        for line in resp.iter_lines(decode_unicode=True):
+            if not line:
+                continue
+            if line.startswith("data:"):
+                yield json.loads(line[5:].strip())
+            elif line.startswith(":"):
+                # Idle keepalive: use it to notice a stopped analysis
+                status = get_dashboard_status()
+                if status is None or not status.get('is_running', False):
+                    return
+    except requests.exceptions.RequestException:
+        return
+    finally:
+        resp.close()
+
+
 def convert_to_irds_feedback(reading: dict, modifier: GestureModifier) -> PainFeedback:
     """Convert dashboard reading to IRDS feedback."""
-    # Map face detection levels to pain levels
-    level_map = {
-        'NONE': 0,
-        'MILD': 1,
-        'MODERATE': 2,
-        'SEVERE': 3,
-        'EXTREME': 4
-    }
-    
-    level = reading.get('level', 'NONE')
-    pain_level = level_map.get(level, 0)
-    pain_score = reading.get('pain_score', 0)
-    
+    get = reading.get
+    level = get('level', 'NONE')
+    pain_level = LEVEL_MAP.get(level, 0)
+    pain_score = get('pain_score', 0)
+    face_detected = get('face_detected', False)
+
+    details = {k: get(k, 0) for k in DETAIL_KEYS}
+    details['face_detected'] = face_detected
+
     return modifier.create_feedback(
         pain_level=pain_level,
         pain_level_name=level,
         pain_score=pain_score,
         source='face',
-        confidence=0.9 if reading.get('face_detected', False) else 0.0,
-        details={
-            'brow_furrow': reading.get('brow_furrow', 0),
-            'eye_squeeze': reading.get('eye_squeeze', 0),
-            'nose_wrinkle': reading.get('nose_wrinkle', 0),
-            'lip_raise': reading.get('lip_raise', 0),
-            'face_detected': reading.get('face_detected', False)
-        }
+        confidence=0.9 if face_detected else 0.0,
+        details=details
     )
 
 
@@ -98,35 +180,55 @@ def print_header():
     print("=" * 65)
 
 
+# Status styling precomputed per pain level: (emoji prefix, stop tag,
+# pause tag) with colors baked in, so the per-frame path only formats
+# the numbers instead of rebuilding the emoji/color lists each call
+_RESET = "\033[0m"
+_STATUS_STYLES = tuple(
+    (f"{color}{emoji} ",
+     f" | {color}🛑 STOP{_RESET}",
+     f" | {color}⏸️ PAUSE{_RESET}")
+    for emoji, color in zip(
+        ["😊", "😐", "😣", "😖", "😫"],
+        ["\033[92m", "\033[93m", "\033[93m", "\033[91m", "\033[91m"]
+    )
+)
+
+
+# Flush the status line every Nth frame rather than per frame; safety
+# flags force an immediate flush
+_FLUSH_EVERY = 4
+_status_frames = 0
+
+
 def print_status(feedback: PainFeedback, frame: int):
     """Print current status."""
-    emojis = ["😊", "😐", "😣", "😖", "😫"]
-    emoji = emojis[min(feedback.pain_level, 4)]
-    
-    colors = ["\033[92m", "\033[93m", "\033[93m", "\033[91m", "\033[91m"]
-    color = colors[min(feedback.pain_level, 4)]
-    reset = "\033[0m"
-    
-    status = f"{color}{emoji} {feedback.pain_level_name:10}{reset}"
-    
-    line = (f"#{frame:4d} | {status} | "
+    global _status_frames
+
+    prefix, stop_tag, pause_tag = _STATUS_STYLES[min(feedback.pain_level, 4)]
+
+    line = (f"\r#{frame:4d} | {prefix}{feedback.pain_level_name:10}{_RESET} | "
             f"Score: {feedback.pain_score:5.1f}% | "
             f"Speed: {feedback.speed_modifier:.0%} | "
             f"Amp: {feedback.amplitude_modifier:.0%}")
-    
+
+    urgent = feedback.should_stop or feedback.should_pause
     if feedback.should_stop:
-        line += f" | {color}🛑 STOP{reset}"
+        line += stop_tag
     elif feedback.should_pause:
-        line += f" | {color}⏸️ PAUSE{reset}"
-    
-    print(f"\r{line}          ", end="", flush=True)
+        line += pause_tag
+
+    sys.stdout.write(f"{line}          ")
+    _status_frames += 1
+    if urgent or _status_frames % _FLUSH_EVERY == 0:
+        sys.stdout.flush()
 
 
 def main():
     print_header()
     
-    # Setup output
-    output_file = project_root / "data" / "irds_feedback.json"
+    # Setup output (RAMDISK=1 puts this on tmpfs)
+    output_file = feedback_file_path(project_root)
     output_file.parent.mkdir(exist_ok=True)
     
     modifier = GestureModifier()
@@ -156,14 +258,17 @@ def main():
         print("   2. Enter your YouTube link")
         print("   3. Click 'Start Analysis'")
         print("\n   Waiting for analysis to start...")
-        
-        # Wait for analysis to start
+
+        # Wait for analysis to start, backing off while idle so a
+        # dashboard left open overnight isn't polled twice a second
+        delay = POLL_INTERVAL
         while True:
             status = get_dashboard_status()
             if status and status.get('is_running', False):
                 break
-            time.sleep(0.5)
-        
+            time.sleep(delay)
+            delay = min(delay * 1.5, 5.0)
+
         print("✓ Analysis started!")
     
     print("\n" + "-" * 65)
@@ -171,48 +276,94 @@ def main():
     print("-" * 65 + "\n")
     
     frame_count = 0
-    last_reading = None
-    
+    last_digest = None
+    last_written = None
+    tmp_file = output_file.with_suffix('.json.tmp')
+
+    def publish_reading(reading):
+        nonlocal frame_count, last_written
+        frame_count += 1
+        feedback = convert_to_irds_feedback(reading, modifier)
+        # Skip the serialize + write when nothing the robot acts on has
+        # changed (every to_json() differs trivially by its timestamp)
+        key = (feedback.pain_level, round(feedback.pain_score, 1),
+               feedback.should_pause, feedback.should_stop)
+        if key != last_written:
+            last_written = key
+            # Write-then-rename so the IRDS side never reads a
+            # half-written file. to_json_bytes() keeps the whole
+            # serialize+write in bytes (orjson when available), with
+            # no intermediate str and no encode on write
+            tmp_file.write_bytes(feedback.to_json_bytes())
+            os.replace(tmp_file, output_file)
+        print_status(feedback, frame_count)
+
     try:
-        while True:
-            # Check status
-            status = get_dashboard_status()
-            if status is None or not status.get('is_running', False):
-                if frame_count > 0:
-                    print("\n\n📹 Analysis stopped")
-                    break
-                time.sleep(0.5)
-                continue
-            
-            # Get reading
-            reading = get_dashboard_reading()
-            if reading is None:
-                time.sleep(POLL_INTERVAL)
-                continue
-            
-            # Only process new readings
-            if reading == last_reading:
+        # Preferred path: the dashboard pushes each new reading over
+        # SSE, so there is nothing to poll and nothing to deduplicate
+        for reading in stream_dashboard_readings():
+            publish_reading(reading)
+
+        if frame_count > 0:
+            print("\n\n📹 Analysis stopped")
+        else:
+            # Older dashboard without /api/stream: poll the REST API at
+            # POLL_INTERVAL as before. Prefer /api/combined (status and
+            # reading in one request per tick); a dashboard too old to
+            # serve it gets the legacy two-endpoint path, with the
+            # rarely-changing status re-checked at most once per second
+            use_combined = get_dashboard_combined() is not None
+            STATUS_INTERVAL = 1.0
+            last_status_check = 0.0
+            status = None
+            # Idle backoff: grows while the dashboard is stopped or
+            # unreachable, resets to the poll interval on any reading
+            idle_delay = POLL_INTERVAL
+            while True:
+                if use_combined:
+                    combo = get_dashboard_combined()
+                    status = combo.get('status') if combo else None
+                    reading = combo.get('reading') if combo else None
+                else:
+                    # Check status (throttled)
+                    now = time.monotonic()
+                    if now - last_status_check >= STATUS_INTERVAL:
+                        last_status_check = now
+                        status = get_dashboard_status()
+
+                if status is None or not status.get('is_running', False):
+                    if frame_count > 0:
+                        print("\n\n📹 Analysis stopped")
+                        break
+                    time.sleep(idle_delay)
+                    idle_delay = min(idle_delay * 1.5, 5.0)
+                    continue
+
+                # Get reading
+                if not use_combined:
+                    reading = get_dashboard_reading()
+                if reading is None:
+                    time.sleep(POLL_INTERVAL)
+                    continue
+                idle_delay = POLL_INTERVAL
+
+                # Only process new readings
+                digest = reading_digest(reading)
+                if digest == last_digest:
+                    time.sleep(POLL_INTERVAL)
+                    continue
+
+                last_digest = digest
+                publish_reading(reading)
+
                 time.sleep(POLL_INTERVAL)
-                continue
-            
-            last_reading = reading
-            frame_count += 1
-            
-            # Convert to IRDS feedback
-            feedback = convert_to_irds_feedback(reading, modifier)
-            
-            # Write to file
-            with open(output_file, 'w') as f:
-                f.write(feedback.to_json())
-            
-            # Print status
-            print_status(feedback, frame_count)
-            
-            time.sleep(POLL_INTERVAL)
-            
+
     except KeyboardInterrupt:
         print("\n\n⏹️ Stopped by user")
-    
+    finally:
+        # Push out any status line still sitting in the write buffer
+        sys.stdout.flush()
+
     # Summary
     print("\n" + "-" * 65)
     print(f"\n✓ Complete! Published {frame_count} feedback updates")
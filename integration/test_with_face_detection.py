@@ -16,11 +16,15 @@ Usage:
     python integration/test_with_face_detection.py --webcam
 """
 
+import os
 import sys
 import time
 import json
+import queue
+import select
 import argparse
 import threading
+from collections import namedtuple
 from pathlib import Path
 
 # Add parent to path
@@ -30,10 +34,25 @@ from integration.irds_interface import (
     FeedbackPublisher,
     GestureModifier,
     face_to_feedback,
-    PainFeedback
+    PainFeedback,
+    _inotify_watch,
+    _loads,
+    feedback_file_path
 )
 
 
+# Flat reading record for feeding detector results into
+# face_to_feedback; defined once at module scope so the frame loop
+# doesn't execute a class statement (new type object and method table)
+# per frame
+MockFaceReading = namedtuple('MockFaceReading', [
+    'pain_score', 'level', 'brow_furrow', 'eye_squeeze',
+    'nose_wrinkle', 'lip_raise', 'face_detected', 'frame_number'
+])
+
+_NO_FEATURES = {}
+
+
 def print_header():
     print("\n" + "=" * 70)
     print("  IRDS Integration Test - Face Pain Detection")
@@ -77,31 +96,68 @@ def print_feedback(feedback: PainFeedback, step: int):
         print(f"  ✓ Gesture executing normally")
 
 
+def _print_feedback_file(feedback_file: Path, step: int) -> int:
+    """Read the feedback file and print it; returns the next step number."""
+    try:
+        # _loads is orjson when installed; reading bytes avoids the
+        # text-layer decode on every update
+        feedback = PainFeedback.from_dict(_loads(feedback_file.read_bytes()))
+    except Exception:
+        return step
+    print_feedback(feedback, step + 1)
+    return step + 1
+
+
 def monitor_feedback_file(feedback_file: Path, stop_event: threading.Event):
     """Monitor the feedback file and print updates."""
-    last_mtime = 0
     step = 0
-    
+
     print("\n📊 Monitoring pain feedback...")
     print("   (Modifiers update as face detection runs)\n")
-    
-    while not stop_event.is_set():
-        try:
-            if feedback_file.exists():
+
+    # Sleep on inotify when the kernel supports it: each completed
+    # write wakes us immediately, so there is no stat() polling while
+    # idle. The timeout only bounds how fast stop_event is noticed.
+    feedback_file.parent.mkdir(parents=True, exist_ok=True)
+    inotify_fd = _inotify_watch(str(feedback_file.parent))
+
+    if inotify_fd is None:
+        # No inotify (non-Linux): fall back to mtime polling
+        last_mtime = 0
+        while not stop_event.is_set():
+            try:
+                if feedback_file.exists():
+                    mtime = feedback_file.stat().st_mtime
+                    if mtime > last_mtime:
+                        last_mtime = mtime
+                        step = _print_feedback_file(feedback_file, step)
+            except Exception:
+                pass
+            time.sleep(0.5)
+        return
+
+    # The watch covers the whole directory, so the publisher's .tmp and
+    # history files wake us too; a cheap mtime check on wakeup keeps
+    # each publish to one print.
+    last_mtime = 0
+    try:
+        while not stop_event.is_set():
+            readable, _, _ = select.select([inotify_fd], [], [], 0.5)
+            if not readable:
+                continue
+            try:
+                os.read(inotify_fd, 4096)  # drain queued events
+            except BlockingIOError:
+                pass
+            try:
                 mtime = feedback_file.stat().st_mtime
-                if mtime > last_mtime:
-                    last_mtime = mtime
-                    step += 1
-                    
-                    with open(feedback_file) as f:
-                        data = json.load(f)
-                    
-                    feedback = PainFeedback.from_dict(data)
-                    print_feedback(feedback, step)
-        except Exception as e:
-            pass
-        
-        time.sleep(0.5)
+            except OSError:
+                continue
+            if mtime > last_mtime:
+                last_mtime = mtime
+                step = _print_feedback_file(feedback_file, step)
+    finally:
+        os.close(inotify_fd)
 
 
 def run_face_detection(source: str, output_file: Path):
@@ -147,36 +203,52 @@ def run_face_detection(source: str, output_file: Path):
     print(f"✓ Video source opened")
     print(f"\n📤 Publishing feedback to: {output_file}")
     
+    # Two-stage pipeline: a grabber thread reads frames ahead while
+    # this thread runs detection. The bounded queue supplies the
+    # backpressure the old time.sleep(0.1) approximated - the grabber
+    # blocks when detection falls behind, and detection is never
+    # capped below what the detector can actually sustain.
+    frame_q: queue.Queue = queue.Queue(maxsize=2)
+
+    def grab_frames():
+        """Producer: feed frames into the queue; None means end of video."""
+        try:
+            while True:
+                frame = video.read_frame()
+                frame_q.put(frame)
+                if frame is None:
+                    return
+        except Exception:
+            frame_q.put(None)
+
+    threading.Thread(target=grab_frames, daemon=True).start()
+
     frame_count = 0
     try:
         while True:
-            frame = video.read_frame()
+            frame = frame_q.get()
             if frame is None:
                 break
-            
+
             # Detect pain
             result = detector.detect_pain(frame)
             frame_count += 1
             
             # Create mock reading for conversion
-            class MockFaceReading:
-                def __init__(self, r):
-                    self.pain_score = r['pain_score']
-                    self.level = r['level']
-                    self.brow_furrow = r['features'].get('brow_furrow', 0)
-                    self.eye_squeeze = r['features'].get('eye_squeeze', 0)
-                    self.nose_wrinkle = r['features'].get('nose_wrinkle', 0)
-                    self.lip_raise = r['features'].get('lip_raise', 0)
-                    self.face_detected = r['face_detected']
-                    self.frame_number = frame_count
-            
-            reading = MockFaceReading(result)
+            features = result.get('features', _NO_FEATURES)
+            reading = MockFaceReading(
+                pain_score=result['pain_score'],
+                level=result['level'],
+                brow_furrow=features.get('brow_furrow', 0),
+                eye_squeeze=features.get('eye_squeeze', 0),
+                nose_wrinkle=features.get('nose_wrinkle', 0),
+                lip_raise=features.get('lip_raise', 0),
+                face_detected=result['face_detected'],
+                frame_number=frame_count
+            )
             feedback = face_to_feedback(reading, modifier)
             publisher.publish(feedback)
-            
-            # Small delay to not overwhelm
-            time.sleep(0.1)
-            
+
     except KeyboardInterrupt:
         pass
     finally:
@@ -201,9 +273,9 @@ def main():
     
     print_header()
     
-    # Setup paths
+    # Setup paths (RAMDISK=1 puts the feedback file on tmpfs)
     project_root = Path(__file__).parent.parent
-    output_file = project_root / "data" / "irds_feedback.json"
+    output_file = feedback_file_path(project_root)
     output_file.parent.mkdir(exist_ok=True)
     
     if args.monitor_only:
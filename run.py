@@ -14,7 +14,11 @@ Usage:
 """
 
 import argparse
+import logging
+import queue
+import signal
 import sys
+import threading
 import time
 from pathlib import Path
 
@@ -38,28 +42,51 @@ class Colors:
     GRAY = "\033[90m"
 
 
-# Color mapping for pressure levels
-LEVEL_COLORS = {
-    "NONE": Colors.GREEN,
-    "LIGHT": Colors.YELLOW,
-    "MODERATE": Colors.ORANGE,
-    "HIGH": Colors.RED,
-    "CRITICAL": Colors.MAGENTA,
-}
+# Color per pressure level, indexed by PressureReading.level_idx so
+# the display path does integer indexing instead of a string-keyed
+# dict lookup per reading
+LEVEL_COLORS = (
+    Colors.GREEN,    # NONE
+    Colors.YELLOW,   # LIGHT
+    Colors.ORANGE,   # MODERATE
+    Colors.RED,      # HIGH
+    Colors.MAGENTA,  # CRITICAL
+)
 
 
-def create_progress_bar(percent: float, width: int = 40) -> str:
+# All 41 possible bars at the default width, built once at import; the
+# per-reading call is then a single table index with no string
+# allocation
+_BAR_WIDTH = 40
+_BARS = tuple("█" * i + "░" * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1))
+
+
+def create_progress_bar(percent: float, width: int = _BAR_WIDTH) -> str:
     """Create a visual progress bar for pressure level."""
     filled = int(percent / 100 * width)
-    empty = width - filled
-    return "█" * filled + "░" * empty
+    if width == _BAR_WIDTH:
+        return _BARS[min(max(filled, 0), _BAR_WIDTH)]
+    return "█" * filled + "░" * (width - filled)
+
+
+# Last line pushed to the terminal; steady sensor values render to the
+# same string, and rewriting it is pure flicker plus a syscall
+_last_displayed = None
+
+# Flush every Nth redraw instead of per reading; a level change always
+# flushes immediately so alerts aren't delayed by buffering
+_FLUSH_EVERY = 4
+_frames_since_flush = 0
+_last_level = None
 
 
 def display_reading(reading: PressureReading):
     """Display a single pressure reading with visual formatting."""
-    color = LEVEL_COLORS.get(reading.level, Colors.RESET)
+    global _last_displayed, _frames_since_flush, _last_level
+
+    color = LEVEL_COLORS[reading.level_idx]
     bar = create_progress_bar(reading.percent)
-    
+
     # Format output
     output = (
         f"\r{color}"
@@ -70,13 +97,23 @@ def display_reading(reading: PressureReading):
         f"| Filtered: {reading.filtered:4d}"
         f"{Colors.RESET}"
     )
-    
-    print(output, end="", flush=True)
+
+    # Skip the write when the rendered line hasn't changed
+    if output == _last_displayed:
+        return
+    _last_displayed = output
+
+    sys.stdout.write(output)
+    _frames_since_flush += 1
+    if reading.level != _last_level or _frames_since_flush >= _FLUSH_EVERY:
+        _last_level = reading.level
+        _frames_since_flush = 0
+        sys.stdout.flush()
 
 
 def display_reading_detailed(reading: PressureReading):
     """Display detailed reading information."""
-    color = LEVEL_COLORS.get(reading.level, Colors.RESET)
+    color = LEVEL_COLORS[reading.level_idx]
     bar = create_progress_bar(reading.percent)
     
     print(f"\n{Colors.BOLD}{'─' * 60}{Colors.RESET}")
@@ -97,22 +134,20 @@ class FeedbackController:
         self.arm_active = True
         self.last_alert_time = 0
         self.alert_cooldown = 2.0  # Seconds between alerts
-    
+
+        # One handler per level, indexed by level_idx: integer dispatch
+        # replaces the string-compare ladder in the per-reading path
+        self._handlers = (
+            self._normal_operation,                               # NONE
+            lambda r: self._reduce_speed(r, target_speed=80),     # LIGHT
+            lambda r: self._reduce_speed(r, target_speed=50),     # MODERATE
+            lambda r: self._reduce_speed(r, target_speed=20),     # HIGH
+            self._emergency_stop,                                 # CRITICAL
+        )
+
     def process_reading(self, reading: PressureReading):
         """Process a reading and determine robotic arm response."""
-        current_time = time.time()
-        
-        # Determine action based on pressure level
-        if reading.level == "CRITICAL":
-            self._emergency_stop(reading)
-        elif reading.level == "HIGH":
-            self._reduce_speed(reading, target_speed=20)
-        elif reading.level == "MODERATE":
-            self._reduce_speed(reading, target_speed=50)
-        elif reading.level == "LIGHT":
-            self._reduce_speed(reading, target_speed=80)
-        else:  # NONE
-            self._normal_operation(reading)
+        self._handlers[reading.level_idx](reading)
     
     def _emergency_stop(self, reading: PressureReading):
         """Emergency stop the robotic arm."""
@@ -145,12 +180,19 @@ class FeedbackController:
             self.last_alert_time = current_time
 
 
-def run_with_hardware():
-    """Run with actual Arduino hardware."""
+def run_with_hardware(ports=None):
+    """
+    Run with actual Arduino hardware.
+
+    Args:
+        ports: Pre-enumerated serial port list; passing one avoids a
+            second platform port scan when auto-detect already ran it.
+    """
     print(f"\n{Colors.CYAN}{Colors.BOLD}Hardware Mode{Colors.RESET}")
     print("Searching for Arduino...")
-    
-    ports = PiezoSensor.list_available_ports()
+
+    if ports is None:
+        ports = PiezoSensor.list_available_ports()
     if not ports:
         print(f"{Colors.RED}No serial ports found. Is Arduino connected?{Colors.RESET}")
         return False
@@ -188,24 +230,72 @@ def run_with_file(filepath: str, speed: float = 1.0, loop: bool = True):
 def _run_sensor_loop(sensor):
     """Main sensor reading loop."""
     controller = FeedbackController()
-    
+
+    # Terminal rendering runs on its own thread behind a single-slot
+    # queue: a slow TTY (ssh over a WAN, piped output) can then never
+    # back up the sensor callback, it just causes stale frames to be
+    # dropped. The controller stays on the callback thread so
+    # emergency-stop latency is unaffected by display speed.
+    display_q: queue.Queue = queue.Queue(maxsize=1)
+
+    def render_loop():
+        while True:
+            reading = display_q.get()
+            if reading is None:
+                return
+            display_reading(reading)
+
+    render_thread = threading.Thread(target=render_loop, daemon=True)
+    render_thread.start()
+
     def on_reading(reading: PressureReading):
-        display_reading(reading)
+        try:
+            display_q.put_nowait(reading)
+        except queue.Full:
+            # Renderer is behind: drop the stale frame, keep the newest
+            try:
+                display_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                display_q.put_nowait(reading)
+            except queue.Full:
+                pass
         controller.process_reading(reading)
-    
+
     print(f"\n{Colors.BOLD}Press Ctrl+C to stop{Colors.RESET}\n")
-    
+
     sensor.start_reading(callback=on_reading)
-    
+
+    # Ctrl+C sets an Event instead of raising KeyboardInterrupt, so
+    # the main thread can block in the kernel rather than waking ten
+    # times a second just to poll for it
+    stop_ev = threading.Event()
+    old_handler = signal.signal(signal.SIGINT, lambda *_: stop_ev.set())
+
     try:
-        while True:
-            # Check if file-based sensor has finished (non-looping mode)
-            if hasattr(sensor, 'is_finished') and sensor.is_finished:
-                print(f"\n\n{Colors.GREEN}Playback complete!{Colors.RESET}")
-                break
-            time.sleep(0.1)
-    except KeyboardInterrupt:
-        print(f"\n\n{Colors.YELLOW}Stopping...{Colors.RESET}")
+        if hasattr(sensor, 'is_finished'):
+            # File playback: wake only to check for end-of-data
+            # (non-looping mode); Ctrl+C still lands immediately
+            while not stop_ev.wait(timeout=0.5):
+                if sensor.is_finished:
+                    print(f"\n\n{Colors.GREEN}Playback complete!{Colors.RESET}")
+                    break
+        else:
+            # Hardware: nothing to poll, sleep until interrupted
+            stop_ev.wait()
+        if stop_ev.is_set():
+            print(f"\n\n{Colors.YELLOW}Stopping...{Colors.RESET}")
+    finally:
+        signal.signal(signal.SIGINT, old_handler)
+        # Unblock and retire the renderer, then push out any buffered
+        # status line so the last reading shows
+        try:
+            display_q.put_nowait(None)
+        except queue.Full:
+            pass
+        render_thread.join(timeout=1.0)
+        sys.stdout.flush()
     return True
 
 
@@ -253,7 +343,11 @@ Examples:
     )
     
     args = parser.parse_args()
-    
+
+    # The sensor modules report progress through logging; show their
+    # messages on the console the way they used to print
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # Print header
     print(f"\n{Colors.BOLD}{'=' * 60}{Colors.RESET}")
     print(f"{Colors.CYAN}{Colors.BOLD}  Robotic Arm Feedback System - Piezo Sensor Module{Colors.RESET}")
@@ -271,7 +365,7 @@ Examples:
         
         if ports:
             print(f"Arduino detected on {ports}")
-            success = run_with_hardware()
+            success = run_with_hardware(ports)
         else:
             print("No Arduino found, using file simulation")
             success = run_with_file(args.data, args.speed, not args.no_loop)
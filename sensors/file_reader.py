@@ -7,14 +7,77 @@ allowing testing without actual hardware. The classification model
 determines pressure levels from raw sensor readings.
 """
 
-import csv
+import logging
+import os
 import time
 import threading
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from dataclasses import replace
 from pathlib import Path
 from typing import Callable, Optional, Iterator
 from collections import deque
 
-from .piezo_reader import PressureReading
+from .piezo_reader import PressureReading, LEVEL_INDEX
+
+logger = logging.getLogger(__name__)
+
+# Files larger than this are split on newline boundaries and parsed by
+# one worker process per core; below it a single pass is faster than
+# paying process startup and result pickling
+_PARALLEL_BYTES = 64 * 1024 * 1024
+
+
+def _safe(callback: Callable) -> Callable:
+    """
+    Wrap a callback so its errors are logged where it is registered.
+
+    Paying for the try/except once per callback object (here) instead
+    of once per tick keeps exception-handler setup out of the playback
+    loop's dispatch.
+    """
+    def _guarded(reading):
+        try:
+            callback(reading)
+        except Exception:
+            logger.exception("Callback error")
+    return _guarded
+
+
+def _empty_columns() -> tuple:
+    """Fresh (timestamp, pressure, percent, level, level_idx) columns."""
+    return array('q'), array('i'), array('d'), [], array('b')
+
+
+def _parse_chunk(text: str, ts_col: int, pr_col: int) -> tuple:
+    """
+    Parse a newline-aligned slice of the CSV body into data columns.
+
+    Columns are array.array (plus a list for the level strings):
+    packed C values instead of a Python object per cell, so a million
+    rows costs megabytes rather than hundreds of them. Module-level
+    (not a method) so ProcessPoolExecutor workers can import it
+    without pickling a sensor instance.
+    """
+    table = _CLASS_TABLE
+    top = len(table) - 1
+    ts, pressures, percents, levels, codes = _empty_columns()
+    for line in text.splitlines():
+        if not line:
+            continue
+        parts = line.split(',')
+        pressure = int(parts[pr_col])
+        # Clamp-and-index mirrors pressure_to_percent's clamping
+        idx = 0 if pressure < 0 else (top if pressure > top else pressure)
+        percent, level, code = table[idx]
+        ts.append(int(parts[ts_col]))
+        pressures.append(pressure)
+        percents.append(percent)
+        levels.append(level)
+        codes.append(code)
+    return ts, pressures, percents, levels, codes
 
 
 class PressureClassifier:
@@ -44,7 +107,14 @@ class PressureClassifier:
     
     # Max pressure value (baseline offset from 1023 max ADC value)
     MAX_PRESSURE = 511
-    
+
+    # Sorted upper bounds of the first four levels; bisect_right maps a
+    # percent straight to its slot in _LEVELS, replacing the four-branch
+    # comparison ladder with one C-implemented binary search
+    _BOUNDS = (5, 20, 50, 80)
+    _LEVELS = (LEVEL_NONE, LEVEL_LIGHT, LEVEL_MODERATE, LEVEL_HIGH,
+               LEVEL_CRITICAL)
+
     def __init__(self):
         """Initialize the pressure classifier."""
         pass
@@ -73,17 +143,7 @@ class PressureClassifier:
             Classification level string
         """
         percent = self.pressure_to_percent(pressure)
-        
-        if percent < self.THRESHOLDS['NONE'][1]:
-            return self.LEVEL_NONE
-        elif percent < self.THRESHOLDS['LIGHT'][1]:
-            return self.LEVEL_LIGHT
-        elif percent < self.THRESHOLDS['MODERATE'][1]:
-            return self.LEVEL_MODERATE
-        elif percent < self.THRESHOLDS['HIGH'][1]:
-            return self.LEVEL_HIGH
-        else:
-            return self.LEVEL_CRITICAL
+        return self._LEVELS[bisect_right(self._BOUNDS, percent)]
     
     def get_classification_details(self, pressure: int) -> dict:
         """
@@ -95,15 +155,27 @@ class PressureClassifier:
         Returns:
             Dictionary with percent and level
         """
+        # Convert once and derive the level from the same percent
+        # rather than re-running the conversion inside classify()
         percent = self.pressure_to_percent(pressure)
-        level = self.classify(pressure)
-        
+        level = self._LEVELS[bisect_right(self._BOUNDS, percent)]
+
         return {
             'percent': round(percent, 2),
             'level': level
         }
 
 
+# The whole ADC domain (0..MAX_PRESSURE) classified once at import:
+# bulk parsing indexes this table instead of re-deriving percent and
+# level per row. 512 entries of (percent, level, level_idx).
+_CLASS_TABLE = tuple(
+    (c['percent'], c['level'], LEVEL_INDEX.get(c['level'], 0))
+    for c in (PressureClassifier().get_classification_details(p)
+              for p in range(PressureClassifier.MAX_PRESSURE + 1))
+)
+
+
 class FilePiezoSensor:
     """
     Mock piezo sensor that reads data from a CSV file.
@@ -130,121 +202,209 @@ class FilePiezoSensor:
         filepath: str,
         playback_speed: float = 1.0,
         loop: bool = True,
-        history_size: int = 100
+        history_size: int = 100,
+        lazy: bool = False
     ):
         """
         Initialize the file-based sensor reader.
-        
+
         Args:
             filepath: Path to CSV file with sensor data (timestamp, pressure)
             playback_speed: Speed multiplier (1.0 = real-time, 2.0 = 2x speed)
             loop: Whether to loop back to start when file ends
             history_size: Number of readings to keep in history
+            lazy: Defer parsing the file until data is first needed
+                (connect only checks the file exists)
         """
         self.filepath = Path(filepath)
         self.playback_speed = playback_speed
         self.loop = loop
         self.history_size = history_size
+        self.lazy = lazy
         
         # Initialize classifier model
         self._classifier = PressureClassifier()
         
-        self._data: list[dict] = []
+        # Columns of (timestamp, pressure, percent, level, level_idx),
+        # classified once at load time so looped playback re-derives
+        # nothing. SoA array.array columns, not a list of row tuples:
+        # see _parse_chunk.
+        (self._ts, self._pressures, self._percents,
+         self._levels, self._level_codes) = _empty_columns()
+        # Fully-built readings, one per row, materialized at connect()
+        # so the playback tick does no construction work of its own
+        self._readings: tuple = ()
+        # Per-row wake offsets in ns from lap start, precomputed at
+        # start_reading for the current playback speed
+        self._offsets_ns: tuple = ()
         self._current_index = 0
         self._reading_thread: Optional[threading.Thread] = None
         self._stop_flag = threading.Event()
+        # Mutable cell mirroring the Event. The loop's per-tick check
+        # reads stop_cell[0] - a list index - instead of Event.is_set,
+        # which takes the event's internal condition lock every call.
+        # The Event itself is still what the pacing wait() sleeps on.
+        self._stop_cell = [False]
         self._finished_flag = threading.Event()  # Signals when playback is done
         self._history: deque = deque(maxlen=history_size)
-        self._callbacks: list[Callable[[PressureReading], None]] = []
+        # Parallel column of bare percent floats: averaging reduces
+        # over these instead of fetching an attribute from each
+        # PressureReading object in the window
+        self._hist_percent: deque = deque(maxlen=history_size)
+        # Registry keyed by id(callback) for O(1) add/remove, plus a
+        # tuple snapshot the reading loop iterates without taking a
+        # dict view per tick (rebuilt only when the registry changes)
+        self._callbacks: dict[int, Callable[[PressureReading], None]] = {}
+        self._callbacks_t: tuple = ()
         self._is_connected = False
+        self._loaded = False
         self._baseline = 512  # Default baseline
-        
+
     def connect(self) -> bool:
         """
         Load the CSV file and prepare for reading.
-        
+
         CSV format: timestamp, pressure
         - timestamp: milliseconds since start
         - pressure: raw pressure value (0-511)
-        
+
         Returns:
             True if file loaded successfully
         """
         if not self.filepath.exists():
             raise FileNotFoundError(f"Sensor data file not found: {self.filepath}")
-        
-        self._data = []
-        
-        with open(self.filepath, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Read only timestamp and pressure from CSV
-                timestamp = int(row['timestamp'])
-                pressure = int(row['pressure'])
-                
-                self._data.append({
-                    'timestamp': timestamp,
-                    'pressure': pressure
-                })
-        
-        if not self._data:
-            raise ValueError("CSV file is empty or has invalid format")
-        
+
+        if not self.lazy:
+            self._load_file()
+
         self._current_index = 0
         self._is_connected = True
-        print(f"Loaded {len(self._data)} readings from {self.filepath}")
         return True
+
+    def _ensure_loaded(self):
+        """Parse the file now if connect() deferred it (lazy mode)."""
+        if not self._loaded:
+            self._load_file()
+
+    def _load_file(self):
+        """Parse the CSV into columns and materialize the readings."""
+        # Slurp and split in bulk: one read() plus str.splitlines/split
+        # runs in C and skips the csv module's per-row tokenizer state
+        # machine entirely. Sensor logs are plain numeric columns, so
+        # quoting rules never apply.
+        text = self.filepath.read_text()
+        newline = text.find('\n')
+        if newline < 0:
+            raise ValueError("CSV file is empty or has invalid format")
+
+        # Resolve column positions once instead of paying a dict
+        # allocation and two hashed lookups per row (DictReader)
+        header = text[:newline].split(',')
+        try:
+            ts_col = header.index('timestamp')
+            pr_col = header.index('pressure')
+        except ValueError:
+            raise ValueError(
+                "CSV file must have 'timestamp' and 'pressure' columns"
+            )
+
+        body = text[newline + 1:]
+        if len(body) >= _PARALLEL_BYTES:
+            # Large log: slice the body into one newline-aligned chunk
+            # per core and parse the chunks in worker processes.
+            # Classification happens in the workers too, so the
+            # columns come back ready to use.
+            workers = os.cpu_count() or 1
+            chunks = []
+            size = len(body)
+            step = size // workers or size
+            pos = 0
+            while pos < size:
+                cut = pos + step
+                end = body.find('\n', cut) if cut < size else -1
+                if end < 0:
+                    chunks.append(body[pos:])
+                    break
+                chunks.append(body[pos:end + 1])
+                pos = end + 1
+
+            columns = _empty_columns()
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                n = len(chunks)
+                for chunk_columns in pool.map(_parse_chunk, chunks,
+                                              [ts_col] * n, [pr_col] * n):
+                    for dst, src in zip(columns, chunk_columns):
+                        dst.extend(src)
+        else:
+            columns = _parse_chunk(body, ts_col, pr_col)
+
+        (self._ts, self._pressures, self._percents,
+         self._levels, self._level_codes) = columns
+
+        if not self._ts:
+            raise ValueError("CSV file is empty or has invalid format")
+
+        # Materialize every reading now: the file is immutable, so all
+        # N allocations happen once here instead of once per tick (and
+        # once per lap in looping mode). received_at is stamped per
+        # read in read_once.
+        baseline = self._baseline
+        self._readings = tuple(
+            PressureReading(
+                raw=baseline + pressure,
+                filtered=baseline + pressure,  # In simulation, filtered = raw
+                pressure=pressure,
+                percent=percent,
+                level=level,
+                timestamp=timestamp,
+                received_at=0.0,
+                level_idx=level_idx
+            )
+            for timestamp, pressure, percent, level, level_idx
+            in zip(self._ts, self._pressures, self._percents,
+                   self._levels, self._level_codes)
+        )
+
+        self._loaded = True
+        logger.info("Loaded %d readings from %s", len(self._ts), self.filepath)
     
     def disconnect(self):
         """Stop reading and clean up."""
         self.stop_reading()
         self._is_connected = False
-        print("File sensor disconnected")
-    
-    def _create_reading(self, data: dict) -> PressureReading:
-        """
-        Create a PressureReading from CSV data.
-        Uses the classifier model to determine level and percent.
-        """
-        pressure = data['pressure']
-        
-        # Use classifier model to compute level and percent
-        classification = self._classifier.get_classification_details(pressure)
-        
-        # Simulate raw and filtered values (in real hardware these would differ)
-        raw_value = self._baseline + pressure
-        filtered_value = raw_value  # In simulation, filtered = raw
-        
-        return PressureReading(
-            raw=raw_value,
-            filtered=filtered_value,
-            pressure=pressure,
-            percent=classification['percent'],
-            level=classification['level'],
-            timestamp=data['timestamp'],
-            received_at=time.time()
-        )
+        logger.info("File sensor disconnected")
     
+    def _next_reading(self) -> Optional[PressureReading]:
+        """Advance the cursor and return the prebuilt (unstamped) reading."""
+        if not self._is_connected:
+            return None
+        self._ensure_loaded()
+        if not self._readings:
+            return None
+
+        if self._current_index >= len(self._readings):
+            if self.loop:
+                self._current_index = 0
+            else:
+                return None
+
+        reading = self._readings[self._current_index]
+        self._current_index += 1
+        return reading
+
     def read_once(self) -> Optional[PressureReading]:
         """
         Read the next data point from the file.
-        
+
         Returns:
             PressureReading or None if at end and not looping
         """
-        if not self._is_connected or not self._data:
+        reading = self._next_reading()
+        if reading is None:
             return None
-        
-        if self._current_index >= len(self._data):
-            if self.loop:
-                self._current_index = 0
-            else:
-                return None
-        
-        data = self._data[self._current_index]
-        self._current_index += 1
-        
-        return self._create_reading(data)
+
+        # Copy-with-timestamp: everything else was built at connect()
+        return replace(reading, received_at=time.time())
     
     def start_reading(
         self,
@@ -257,76 +417,176 @@ class FilePiezoSensor:
             callback: Function to call with each reading
         """
         if self._reading_thread and self._reading_thread.is_alive():
-            print("Already reading")
+            logger.warning("Already reading")
             return
-        
+
         if callback:
-            self._callbacks.append(callback)
-        
+            self.add_callback(callback)
+
+        # Bake the whole wake schedule up front: one pass of float
+        # math here leaves the playback tick as pure tuple indexing.
+        # File timestamps are ms; offsets are ns from lap start at the
+        # current playback speed.
+        self._ensure_loaded()
+        if self._ts:
+            ns_per_unit = 1e6 / self.playback_speed
+            ts0 = self._ts[0]
+            self._offsets_ns = tuple(
+                int((ts - ts0) * ns_per_unit) for ts in self._ts
+            )
+
         self._current_index = 0
+        self._stop_cell[0] = False
         self._stop_flag.clear()
         self._finished_flag.clear()
         self._reading_thread = threading.Thread(target=self._reading_loop, daemon=True)
         self._reading_thread.start()
-        print(f"Started playback at {self.playback_speed}x speed")
+        logger.info("Started playback at %sx speed", self.playback_speed)
     
     def stop_reading(self):
         """Stop continuous reading."""
+        self._stop_cell[0] = True
         self._stop_flag.set()
         
         if self._reading_thread:
             self._reading_thread.join(timeout=2.0)
             self._reading_thread = None
-        
+
         self._callbacks.clear()
-        print("Stopped reading")
+        self._callbacks_t = ()
+        logger.info("Stopped reading")
     
     def _reading_loop(self):
         """Background thread for timed playback."""
-        last_timestamp = None
-        
-        while not self._stop_flag.is_set():
-            reading = self.read_once()
-            
-            if reading is None:
-                if not self.loop:
-                    print("\nEnd of data file reached")
-                    self._finished_flag.set()
+        # The schedule is fully precomputed in start_reading, so the
+        # tick is tuple indexing plus one wait. A compiled-extension
+        # kernel would buy little here: the loop spends its life
+        # sleeping or inside user callbacks, not in the interpreter.
+        readings = self._readings
+        offsets = self._offsets_ns
+        n = len(readings)
+        if n == 0:
+            self._finished_flag.set()
+            return
+
+        # Map the perf_counter timeline onto the epoch once: each
+        # sample's received_at is then derived from its wake target
+        # instead of a time.time() syscall per tick
+        epoch_ns = time.time_ns() - time.perf_counter_ns()
+
+        # Hoist everything the loop touches per tick into locals:
+        # LOAD_FAST instead of an attribute lookup per access. Speed
+        # and loop mode are read once here, so changing them during
+        # playback takes effect on the next start_reading.
+        stop_cell = self._stop_cell
+        stop_wait = self._stop_flag.wait
+        hist_append = self._history.append
+        pct_append = self._hist_percent.append
+        perf_ns = time.perf_counter_ns
+        loop_flag = self.loop
+
+        # Absolute scheduling: each sample's wake time is derived from
+        # the lap start, not from the previous sleep, so sleep slack
+        # and loop overhead never accumulate into playback drift
+        start_ns = perf_ns()
+        i = self._current_index
+
+        while not stop_cell[0]:
+            if i >= n:
+                if not loop_flag:
+                    logger.info("End of data file reached")
                     break
-                continue
-            
-            # Calculate delay based on timestamps
-            if last_timestamp is not None:
-                delay = (reading.timestamp - last_timestamp) / 1000.0  # Convert ms to seconds
-                delay /= self.playback_speed
-                
-                if delay > 0:
-                    time.sleep(delay)
-            
-            last_timestamp = reading.timestamp
-            
-            self._history.append(reading)
-            
-            for callback in self._callbacks:
-                try:
+                # File wrapped in looping mode: rebase the schedule
+                i = 0
+                start_ns = perf_ns()
+
+            target = start_ns + offsets[i]
+            remaining = target - perf_ns()
+            # Wait on the stop event rather than time.sleep: the
+            # same syscall does the pacing AND lets stop_reading()
+            # cut a long wait short instead of waiting it out
+            if remaining > 0 and stop_wait(remaining / 1e9):
+                break
+
+            reading = replace(readings[i],
+                              received_at=(epoch_ns + target) * 1e-9)
+            i += 1
+            self._current_index = i  # keep current_position truthful
+
+            hist_append(reading)
+            pct_append(reading.percent)
+
+            # _callbacks_t is re-read per tick on purpose: add/remove
+            # during playback swaps in a fresh snapshot tuple. Each
+            # entry is already a _safe trampoline, so the dispatch
+            # runs without a per-call exception frame; the outer try
+            # is a last-resort net only.
+            try:
+                for callback in self._callbacks_t:
                     callback(reading)
-                except Exception as e:
-                    print(f"Callback error: {e}")
-        
+            except Exception:
+                logger.exception("Callback dispatch error")
+
         self._finished_flag.set()
-    
+
     def add_callback(self, callback: Callable[[PressureReading], None]):
         """Add a callback for readings."""
-        self._callbacks.append(callback)
-    
+        # Stored pre-wrapped in a _safe trampoline; keyed by the
+        # original object's id so remove_callback still matches
+        self._callbacks[id(callback)] = _safe(callback)
+        self._callbacks_t = tuple(self._callbacks.values())
+
     def remove_callback(self, callback: Callable[[PressureReading], None]):
         """Remove a callback."""
-        if callback in self._callbacks:
-            self._callbacks.remove(callback)
+        self._callbacks.pop(id(callback), None)
+        self._callbacks_t = tuple(self._callbacks.values())
     
+    def iter_batches(self, batch_size: int = 256) -> Iterator[dict]:
+        """
+        Yield the loaded file in column batches for bulk analysis.
+
+        Each batch maps column name to a slice of the packed columns
+        built at connect(), so windowed stats (averages, thresholding)
+        can reduce over batch_size values at a time instead of paying
+        per-sample callback and attribute overhead.
+
+        Args:
+            batch_size: Number of rows per batch
+
+        Yields:
+            Dicts with 'timestamp', 'pressure', 'percent', 'level'
+            and 'level_code' columns of up to batch_size values
+        """
+        self._ensure_loaded()
+        ts = self._ts
+        pressures = self._pressures
+        percents = self._percents
+        levels = self._levels
+        codes = self._level_codes
+        for i in range(0, len(ts), batch_size):
+            j = i + batch_size
+            yield {
+                'timestamp': ts[i:j],
+                'pressure': pressures[i:j],
+                'percent': percents[i:j],
+                'level': levels[i:j],
+                'level_code': codes[i:j],
+            }
+
     def get_history(self) -> list[PressureReading]:
         """Get history of recent readings."""
         return list(self._history)
+
+    def iter_history(self) -> Iterator[PressureReading]:
+        """
+        Iterate recent readings oldest-first without copying.
+
+        One-pass consumers should prefer this over get_history, which
+        allocates a full list. Note a deque raises RuntimeError if it
+        grows mid-iteration, so iterate while playback is stopped or
+        fall back to get_history for a stable copy.
+        """
+        return iter(self._history)
     
     def get_latest(self) -> Optional[PressureReading]:
         """Get the most recent reading."""
@@ -335,20 +595,27 @@ class FilePiezoSensor:
     def is_pressure_critical(self) -> bool:
         """Check if current pressure is critical."""
         latest = self.get_latest()
-        return latest and latest.level == self.LEVEL_CRITICAL
-    
+        # Compare the integer level code: one int cmp instead of a
+        # character-walking string comparison
+        return latest is not None and latest.level_idx == 4
+
     def is_pressure_high(self) -> bool:
         """Check if current pressure is high or above."""
         latest = self.get_latest()
-        return latest and latest.level in [self.LEVEL_HIGH, self.LEVEL_CRITICAL]
+        # HIGH and CRITICAL are the top two codes, so "high or above"
+        # is a single >= instead of building a list and scanning it
+        return latest is not None and latest.level_idx >= 3
     
     def get_average_pressure(self, samples: int = 10) -> float:
         """Calculate average pressure from recent readings."""
-        history = list(self._history)
-        if not history:
+        hist = self._hist_percent
+        n = len(hist)
+        if n == 0:
             return 0.0
-        recent = history[-samples:]
-        return sum(r.percent for r in recent) / len(recent)
+        count = min(samples, n)
+        # Sum the float column directly - no list copy of the deque
+        # and no per-object attribute fetch
+        return sum(islice(hist, n - count, n)) / count
     
     @property
     def is_connected(self) -> bool:
@@ -368,7 +635,9 @@ class FilePiezoSensor:
     @property
     def total_readings(self) -> int:
         """Get total number of readings in file."""
-        return len(self._data)
+        if self._is_connected:
+            self._ensure_loaded()
+        return len(self._ts)
     
     @property
     def current_position(self) -> int:
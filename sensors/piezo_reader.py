@@ -6,16 +6,46 @@ This module handles serial communication with an Arduino running
 the piezo sensor sketch and processes pressure readings.
 """
 
+import re
 import json
 import time
+import queue
 import threading
+from array import array
+from itertools import islice
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 from collections import deque
 
 import serial
 import serial.tools.list_ports
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses the small per-sample JSON objects several times faster
+# than the stdlib scanner and takes raw bytes; fall back transparently
+# when it isn't installed (json.loads accepts bytes too)
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Common Arduino identifiers, compiled once: one alternation scan per
+# port instead of a Python loop over keywords with repeated substring
+# searches
+_ARDUINO_RE = re.compile(r'arduino|ch340|cp210|ftdi|usb|acm')
+
+
+# Level name -> integer index, shared by readers so consumers can
+# dispatch on a small int instead of comparing level strings
+LEVEL_INDEX = {
+    "NONE": 0,
+    "LIGHT": 1,
+    "MODERATE": 2,
+    "HIGH": 3,
+    "CRITICAL": 4,
+}
+
 
 @dataclass
 class PressureReading:
@@ -27,6 +57,7 @@ class PressureReading:
     level: str
     timestamp: int
     received_at: float  # Python timestamp when data was received
+    level_idx: int = 0  # Integer form of level (see LEVEL_INDEX)
 
 
 class PiezoSensor:
@@ -74,8 +105,22 @@ class PiezoSensor:
         
         self._serial: Optional[serial.Serial] = None
         self._reading_thread: Optional[threading.Thread] = None
+        self._dispatch_thread: Optional[threading.Thread] = None
+        # Hands parsed readings from the serial thread to the
+        # dispatcher: a slow callback backs up here instead of
+        # stalling reads until the Arduino's buffer overflows
+        self._out_queue: queue.SimpleQueue = queue.SimpleQueue()
+        # Receive buffer for the reading loop's bulk reads; holds the
+        # trailing partial line between chunks
+        self._rx_buf = bytearray()
         self._stop_flag = threading.Event()
         self._history: deque = deque(maxlen=history_size)
+        # Parallel column of bare percent floats plus a running sum
+        # maintained on append: whole-window averages are O(1) and
+        # partial windows reduce over floats instead of fetching an
+        # attribute from each PressureReading object
+        self._hist_percent: deque = deque(maxlen=history_size)
+        self._percent_sum = 0.0
         self._callbacks: list[Callable[[PressureReading], None]] = []
         self._is_ready = False
         self._baseline: Optional[int] = None
@@ -95,18 +140,12 @@ class PiezoSensor:
             Port string if found, None otherwise
         """
         ports = serial.tools.list_ports.comports()
-        
-        # Common Arduino identifiers
-        arduino_keywords = ['arduino', 'ch340', 'cp210', 'ftdi', 'usb', 'acm']
-        
+
         for port in ports:
-            description = (port.description or '').lower()
-            manufacturer = (port.manufacturer or '').lower()
-            
-            for keyword in arduino_keywords:
-                if keyword in description or keyword in manufacturer:
-                    return port.device
-        
+            text = f"{port.description or ''}|{port.manufacturer or ''}".lower()
+            if _ARDUINO_RE.search(text):
+                return port.device
+
         # Fallback: return first USB/ACM port
         for port in ports:
             if 'usb' in port.device.lower() or 'acm' in port.device.lower():
@@ -158,17 +197,18 @@ class PiezoSensor:
         
         while time.time() - start_time < timeout:
             if self._serial.in_waiting:
-                line = self._serial.readline().decode('utf-8', errors='ignore').strip()
-                print(f"Arduino: {line}")
-                
-                if line == "READY":
+                # Compare bytes directly; decode only for the human
+                line = self._serial.readline().rstrip()
+                print(f"Arduino: {line.decode('utf-8', errors='ignore')}")
+
+                if line == b"READY":
                     self._is_ready = True
                     return
-                    
+
                 # Parse baseline value
-                if line.startswith("Baseline calibrated:"):
+                if line.startswith(b"Baseline calibrated:"):
                     try:
-                        self._baseline = int(line.split(":")[1].strip())
+                        self._baseline = int(line.split(b":")[1])
                     except (ValueError, IndexError):
                         pass
         
@@ -193,28 +233,33 @@ class PiezoSensor:
             raise RuntimeError("Not connected to sensor")
         
         try:
-            line = self._serial.readline().decode('utf-8', errors='ignore').strip()
-            
-            if line.startswith('{'):
+            # Keep the line as bytes: the JSON parser takes them
+            # as-is, so there is no utf-8 decode pass per sample
+            line = self._serial.readline().rstrip()
+
+            if line[:1] == b'{':
                 return self._parse_reading(line)
-                
-        except (json.JSONDecodeError, KeyError, ValueError):
+
+        except (KeyError, ValueError):
+            # Covers JSONDecodeError (stdlib and orjson) and bad utf-8
             pass
-            
+
         return None
-    
-    def _parse_reading(self, json_str: str) -> PressureReading:
+
+    def _parse_reading(self, json_line: bytes) -> PressureReading:
         """Parse a JSON reading from Arduino."""
-        data = json.loads(json_str)
+        data = _loads(json_line)
         
+        level = data['level']
         return PressureReading(
             raw=data['raw'],
             filtered=data['filtered'],
             pressure=data['pressure'],
             percent=data['percent'],
-            level=data['level'],
+            level=level,
             timestamp=data['timestamp'],
-            received_at=time.time()
+            received_at=time.time(),
+            level_idx=LEVEL_INDEX.get(level, 0)
         )
     
     def start_reading(
@@ -236,28 +281,101 @@ class PiezoSensor:
         
         self._stop_flag.clear()
         self._reading_thread = threading.Thread(target=self._reading_loop, daemon=True)
+        self._dispatch_thread = threading.Thread(target=self._dispatch_loop, daemon=True)
         self._reading_thread.start()
+        self._dispatch_thread.start()
         print("Started continuous reading")
-    
+
     def stop_reading(self):
         """Stop continuous reading."""
         self._stop_flag.set()
-        
+
         if self._reading_thread:
             self._reading_thread.join(timeout=2.0)
             self._reading_thread = None
-            
+
+        if self._dispatch_thread:
+            # Sentinel wakes the dispatcher out of its blocking get
+            self._out_queue.put(None)
+            self._dispatch_thread.join(timeout=2.0)
+            self._dispatch_thread = None
+
         self._callbacks.clear()
         print("Stopped reading")
-    
+
     def _reading_loop(self):
         """Background thread for continuous reading."""
+        # I/O only: parse and enqueue. Callbacks run on the dispatch
+        # thread, so a slow consumer never delays the next read.
+        #
+        # Reads pull everything the driver has buffered in one
+        # syscall instead of a readline per sample, then split on
+        # newlines here; under load that amortizes dozens of samples
+        # per read() while the kernel refills behind us.
+        ser = self._serial
+        rx_buf = self._rx_buf
+        rx_buf.clear()
+
         while not self._stop_flag.is_set():
-            reading = self.read_once()
-            
-            if reading:
+            try:
+                chunk = ser.read(ser.in_waiting or 1)
+            except serial.SerialException as e:
+                print(f"Serial read error: {e}")
+                break
+            if not chunk:
+                continue  # read timeout, nothing arrived
+
+            rx_buf += chunk
+            if b'\n' not in chunk:
+                continue
+
+            lines = rx_buf.split(b'\n')
+            rx_buf[:] = lines.pop()  # keep the trailing partial line
+
+            for raw in lines:
+                line = raw.rstrip(b'\r')
+                if line[:1] != b'{':
+                    continue
+                try:
+                    reading = self._parse_reading(line)
+                except (KeyError, ValueError):
+                    continue
+
                 self._history.append(reading)
-                
+
+                percents = self._hist_percent
+                if len(percents) == percents.maxlen:
+                    # Full window: retire the value about to be evicted
+                    self._percent_sum -= percents[0]
+                self._percent_sum += reading.percent
+                percents.append(reading.percent)
+
+                self._out_queue.put(reading)
+
+    def _dispatch_loop(self, batch_max: int = 64):
+        """Background thread draining readings to callbacks in batches."""
+        out_queue = self._out_queue
+        stopping = False
+
+        while not stopping:
+            reading = out_queue.get()
+            if reading is None:
+                break
+
+            # Drain whatever else is already queued (up to batch_max)
+            # so a burst costs one wakeup, not one per reading
+            batch = [reading]
+            while len(batch) < batch_max:
+                try:
+                    reading = out_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if reading is None:
+                    stopping = True
+                    break
+                batch.append(reading)
+
+            for reading in batch:
                 for callback in self._callbacks:
                     try:
                         callback(reading)
@@ -276,6 +394,28 @@ class PiezoSensor:
     def get_history(self) -> list[PressureReading]:
         """Get the history of recent readings."""
         return list(self._history)
+
+    def iter_history(self) -> Iterator[PressureReading]:
+        """
+        Iterate recent readings oldest-first without copying.
+
+        One-pass consumers should prefer this over get_history, which
+        allocates a full list. Note a deque raises RuntimeError if it
+        grows mid-iteration, so iterate while reading is stopped or
+        fall back to get_history for a stable copy.
+        """
+        return iter(self._history)
+
+    def get_percent_history(self) -> array:
+        """
+        Get the recent percent values as one packed float column.
+
+        Bulk statistics (std, percentiles, threshold counts) should
+        reduce over this instead of get_history: it is a contiguous
+        array of C doubles copied straight from the column the reading
+        loop maintains, with no PressureReading objects involved.
+        """
+        return array('d', self._hist_percent)
     
     def get_latest(self) -> Optional[PressureReading]:
         """Get the most recent reading."""
@@ -297,15 +437,15 @@ class PiezoSensor:
         start_time = time.time()
         while time.time() - start_time < 5.0:
             if self._serial.in_waiting:
-                line = self._serial.readline().decode('utf-8', errors='ignore').strip()
-                
-                if "New baseline:" in line:
+                line = self._serial.readline().rstrip()
+
+                if b"New baseline:" in line:
                     try:
-                        self._baseline = int(line.split(":")[1].strip())
+                        self._baseline = int(line.split(b":")[1])
                     except (ValueError, IndexError):
                         pass
-                        
-                if line == "CALIBRATION_COMPLETE":
+
+                if line == b"CALIBRATION_COMPLETE":
                     print(f"Calibration complete. New baseline: {self._baseline}")
                     return True
         
@@ -314,29 +454,35 @@ class PiezoSensor:
     def is_pressure_critical(self) -> bool:
         """Check if current pressure level is critical."""
         latest = self.get_latest()
-        return latest and latest.level == self.LEVEL_CRITICAL
-    
+        # Compare the integer level code: one int cmp instead of a
+        # character-walking string comparison
+        return latest is not None and latest.level_idx == 4
+
     def is_pressure_high(self) -> bool:
         """Check if current pressure level is high or above."""
         latest = self.get_latest()
-        return latest and latest.level in [self.LEVEL_HIGH, self.LEVEL_CRITICAL]
+        # HIGH and CRITICAL are the top two codes, so "high or above"
+        # is a single >= instead of building a list and scanning it
+        return latest is not None and latest.level_idx >= 3
     
     def get_average_pressure(self, samples: int = 10) -> float:
         """
         Calculate average pressure from recent readings.
-        
+
         Args:
             samples: Number of recent samples to average
-            
+
         Returns:
             Average pressure percentage
         """
-        history = list(self._history)
-        if not history:
+        percents = self._hist_percent
+        n = len(percents)
+        if n == 0:
             return 0.0
-            
-        recent = history[-samples:]
-        return sum(r.percent for r in recent) / len(recent)
+        if samples >= n:
+            # Whole window: the running sum already has the answer
+            return self._percent_sum / n
+        return sum(islice(percents, n - samples, n)) / samples
     
     @property
     def baseline(self) -> Optional[int]:
@@ -8,15 +8,51 @@ import json
 import time
 import signal
 import atexit
+import hashlib
 import threading
+from collections import namedtuple
 from pathlib import Path
 
-from flask import Flask, render_template, jsonify, Response
+from flask import Flask, render_template, jsonify, request, Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 app = Flask(__name__, template_folder='templates', static_folder='static')
 
-# Global state
-sensor_data = []
+
+def _dumps(obj) -> bytes:
+    """Serialize to JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def ojsonify(obj):
+    """
+    jsonify, minus Flask's stdlib-json detour: orjson emits the bytes
+    Flask's WSGI layer wants directly, which matters on the
+    whole-dataset /api/data payload.
+    """
+    return Response(_dumps(obj), mimetype='application/json')
+
+# Global state. The dataset is published as one immutable snapshot
+# rebound atomically by the loader: rows, pre-serialized SSE frames
+# ("data: ...\n\n" payloads built exactly once) and the row count.
+# Read endpoints grab the current snapshot reference and never take a
+# lock - data_lock only serializes concurrent loads.
+_Snapshot = namedtuple('_Snapshot',
+                       ['rows', 'frames', 'total', 'all_json', 'etag'])
+
+
+def _etag(blob: bytes) -> str:
+    """Content tag for a serialized payload (ETag value, unquoted)."""
+    return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+
+sensor_snapshot = _Snapshot((), (), 0, b'[]', _etag(b'[]'))
 current_index = 0
 is_playing = False
 playback_speed = 1.0
@@ -57,89 +93,128 @@ signal.signal(signal.SIGTERM, signal_handler)
 
 def load_sensor_data(filepath: str):
     """Load sensor data from CSV file."""
-    global sensor_data
-    
+    global sensor_snapshot
+
     # Import here to avoid circular imports
     sys.path.insert(0, str(Path(__file__).parent.parent))
     from sensors.file_reader import PressureClassifier
     
     classifier = PressureClassifier()
+    details = classifier.get_classification_details
+    # Classify each possible clamped pressure value once up front;
+    # rows then index the table instead of re-deriving percent/level
+    top = classifier.MAX_PRESSURE
+    table = [details(p) for p in range(top + 1)]
     data = []
+
+    # Bulk slurp-and-split, same parse the sensors' file reader uses:
+    # one read() plus C-level splitlines/split instead of the csv
+    # module's per-row dict building. Column positions are resolved
+    # once from the header.
+    lines = Path(filepath).read_text().splitlines()
+    if not lines:
+        return 0
+    header = lines[0].split(',')
+    ts_col = header.index('timestamp')
+    pr_col = header.index('pressure')
+
+    for line in lines[1:]:
+        if not line:
+            continue
+        parts = line.split(',')
+        pressure = int(parts[pr_col])
+
+        # Table lookup mirrors pressure_to_percent's clamping
+        idx = 0 if pressure < 0 else (top if pressure > top else pressure)
+        classification = table[idx]
+
+        data.append({
+            'timestamp': int(parts[ts_col]),
+            'raw': 512 + pressure,  # Simulated raw value
+            'filtered': 512 + pressure,
+            'pressure': pressure,
+            'percent': classification['percent'],
+            'level': classification['level']
+        })
     
-    import csv
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            timestamp = int(row['timestamp'])
-            pressure = int(row['pressure'])
-            
-            # Use classifier to compute level and percent
-            classification = classifier.get_classification_details(pressure)
-            
-            data.append({
-                'timestamp': timestamp,
-                'raw': 512 + pressure,  # Simulated raw value
-                'filtered': 512 + pressure,
-                'pressure': pressure,
-                'percent': classification['percent'],
-                'level': classification['level']
-            })
-    
+    # Bake the SSE frames while we're here - description, index and
+    # total included - so streaming is a yield per tick, not a dict
+    # merge plus a JSON encode per tick per client
+    total = len(data)
+    frames = tuple(
+        b"data: " + _dumps({
+            **row,
+            'description': get_level_description(row['level'], row['percent']),
+            'index': i,
+            'total': total,
+        }) + b"\n\n"
+        for i, row in enumerate(data)
+    )
+
+    # The /api/data payload never changes between loads either, so
+    # serialize it once here and tag it for conditional requests
+    all_json = _dumps(data)
+
+    # Publish everything as one new snapshot: a single reference
+    # rebind readers observe either entirely or not at all
     with data_lock:
-        sensor_data = data
-    
-    return len(data)
+        sensor_snapshot = _Snapshot(tuple(data), frames, total,
+                                    all_json, _etag(all_json))
+
+    return total
+
+
+# Static per-level description blocks, built once at import. Callers
+# get a copy with percent/level merged in; the shared base dicts are
+# never handed out, so nothing can mutate them between requests.
+_LEVEL_DESCRIPTIONS = {
+    'NONE': {
+        'title': 'No Pressure Detected',
+        'description': 'The sensor is in its resting state with no significant pressure applied.',
+        'recommendation': 'Normal operation - robotic arm can operate at full speed.',
+        'color': '#10b981',  # Green
+        'icon': '✓',
+        'arm_status': 'Full Speed (100%)'
+    },
+    'LIGHT': {
+        'title': 'Light Pressure',
+        'description': 'Minor pressure detected. This could indicate light contact or the beginning of interaction.',
+        'recommendation': 'Monitor the situation - slight reduction in arm speed recommended.',
+        'color': '#f59e0b',  # Yellow/Amber
+        'icon': '○',
+        'arm_status': 'Reduced Speed (80%)'
+    },
+    'MODERATE': {
+        'title': 'Moderate Pressure',
+        'description': 'Significant pressure detected. The sensor is experiencing notable force.',
+        'recommendation': 'Caution advised - reduce arm speed and monitor closely.',
+        'color': '#f97316',  # Orange
+        'icon': '◐',
+        'arm_status': 'Caution Mode (50%)'
+    },
+    'HIGH': {
+        'title': 'High Pressure',
+        'description': 'High pressure levels detected! This may indicate discomfort or excessive force.',
+        'recommendation': 'Warning - pause robotic arm operation and assess the situation.',
+        'color': '#ef4444',  # Red
+        'icon': '●',
+        'arm_status': 'Paused (20%)'
+    },
+    'CRITICAL': {
+        'title': 'CRITICAL PRESSURE',
+        'description': 'Extremely high pressure detected! Immediate action required to prevent injury.',
+        'recommendation': 'EMERGENCY STOP - Halt all robotic arm operations immediately!',
+        'color': '#dc2626',  # Dark Red
+        'icon': '⚠',
+        'arm_status': 'EMERGENCY STOP (0%)'
+    }
+}
 
 
 def get_level_description(level: str, percent: float) -> dict:
     """Get description and recommendations for each pressure level."""
-    descriptions = {
-        'NONE': {
-            'title': 'No Pressure Detected',
-            'description': 'The sensor is in its resting state with no significant pressure applied.',
-            'recommendation': 'Normal operation - robotic arm can operate at full speed.',
-            'color': '#10b981',  # Green
-            'icon': '✓',
-            'arm_status': 'Full Speed (100%)'
-        },
-        'LIGHT': {
-            'title': 'Light Pressure',
-            'description': 'Minor pressure detected. This could indicate light contact or the beginning of interaction.',
-            'recommendation': 'Monitor the situation - slight reduction in arm speed recommended.',
-            'color': '#f59e0b',  # Yellow/Amber
-            'icon': '○',
-            'arm_status': 'Reduced Speed (80%)'
-        },
-        'MODERATE': {
-            'title': 'Moderate Pressure',
-            'description': 'Significant pressure detected. The sensor is experiencing notable force.',
-            'recommendation': 'Caution advised - reduce arm speed and monitor closely.',
-            'color': '#f97316',  # Orange
-            'icon': '◐',
-            'arm_status': 'Caution Mode (50%)'
-        },
-        'HIGH': {
-            'title': 'High Pressure',
-            'description': 'High pressure levels detected! This may indicate discomfort or excessive force.',
-            'recommendation': 'Warning - pause robotic arm operation and assess the situation.',
-            'color': '#ef4444',  # Red
-            'icon': '●',
-            'arm_status': 'Paused (20%)'
-        },
-        'CRITICAL': {
-            'title': 'CRITICAL PRESSURE',
-            'description': 'Extremely high pressure detected! Immediate action required to prevent injury.',
-            'recommendation': 'EMERGENCY STOP - Halt all robotic arm operations immediately!',
-            'color': '#dc2626',  # Dark Red
-            'icon': '⚠',
-            'arm_status': 'EMERGENCY STOP (0%)'
-        }
-    }
-    
-    info = descriptions.get(level, descriptions['NONE'])
-    info['percent'] = percent
-    info['level'] = level
-    return info
+    base = _LEVEL_DESCRIPTIONS.get(level, _LEVEL_DESCRIPTIONS['NONE'])
+    return {**base, 'percent': percent, 'level': level}
 
 
 @app.route('/')
@@ -151,46 +226,61 @@ def index():
 @app.route('/api/data')
 def get_all_data():
     """Return all sensor data."""
-    with data_lock:
-        return jsonify(sensor_data)
+    snap = sensor_snapshot
+    if snap.etag in request.if_none_match:
+        # Client already holds this exact payload
+        return Response(status=304, headers={'ETag': f'"{snap.etag}"'})
+    return Response(
+        snap.all_json,
+        mimetype='application/json',
+        headers={'ETag': f'"{snap.etag}"',
+                 'Cache-Control': 'public, max-age=3600'}
+    )
 
 
 @app.route('/api/reading/<int:index>')
 def get_reading(index: int):
     """Get a specific reading by index."""
-    with data_lock:
-        if 0 <= index < len(sensor_data):
-            reading = sensor_data[index]
-            reading['description'] = get_level_description(reading['level'], reading['percent'])
-            reading['index'] = index
-            reading['total'] = len(sensor_data)
-            return jsonify(reading)
-        return jsonify({'error': 'Index out of range'}), 404
+    snap = sensor_snapshot
+    if 0 <= index < snap.total:
+        row = snap.rows[index]
+        # Build a fresh response dict: writing description/index
+        # into the stored row would permanently graft response
+        # fields onto the shared dataset (and bloat every later
+        # /api/data payload with them)
+        return ojsonify({
+            **row,
+            'description': get_level_description(row['level'], row['percent']),
+            'index': index,
+            'total': snap.total,
+        })
+    return ojsonify({'error': 'Index out of range'}), 404
 
 
 @app.route('/api/stream')
 def stream_data():
     """Stream sensor data as Server-Sent Events."""
     def generate():
-        index = 0
-        with data_lock:
-            total = len(sensor_data)
-        
-        while index < total and not shutdown_event.is_set():
-            with data_lock:
-                if index < len(sensor_data):
-                    reading = sensor_data[index].copy()
-                    reading['description'] = get_level_description(reading['level'], reading['percent'])
-                    reading['index'] = index
-                    reading['total'] = total
-                    
-                    yield f"data: {json.dumps(reading)}\n\n"
-            
-            index += 1
-            time.sleep(0.1 / playback_speed)  # 100ms between readings, adjusted by speed
-        
+        # Grab the current snapshot once; it is immutable, so the
+        # whole stream needs no lock even if a reload happens mid-way
+        frames = sensor_snapshot.frames
+
+        # At higher playback speeds, send several frames per wakeup
+        # and sleep proportionally longer: the client sees the same
+        # event cadence while the server makes a fraction of the
+        # yields (and WSGI writes) per second
+        speed = playback_speed
+        batch = max(1, int(speed))
+        sleep_per = 0.1 * batch / speed  # 100ms between readings, adjusted by speed
+
+        for i in range(0, len(frames), batch):
+            if shutdown_event.is_set():
+                break
+            yield b"".join(frames[i:i + batch])
+            time.sleep(sleep_per)
+
         # Send end signal
-        yield f"data: {json.dumps({'end': True})}\n\n"
+        yield b"data: " + _dumps({'end': True}) + b"\n\n"
     
     return Response(generate(), mimetype='text/event-stream')
 
@@ -223,7 +313,9 @@ if __name__ == '__main__':
     print("=" * 50 + "\n")
     
     try:
-        # Disable debug mode to avoid duplicate processes
-        app.run(debug=False, host='0.0.0.0', port=args.port)
+        # Disable debug mode to avoid duplicate processes; threaded so
+        # one open SSE stream doesn't block every other request in
+        # development (use web/wsgi.py under gunicorn for real loads)
+        app.run(debug=False, host='0.0.0.0', port=args.port, threaded=True)
     finally:
         cleanup()
@@ -0,0 +1,32 @@
+"""
+WSGI entrypoint for the Piezo Sensor Dashboard.
+
+The built-in Flask development server handles requests on a small
+thread pool; long-lived /api/stream connections eat those threads
+quickly. For anything beyond development, point a production WSGI
+server at this module, e.g.:
+
+    gunicorn -k gevent -w 1 --worker-connections 1000 web.wsgi:app
+
+A single gevent worker multiplexes thousands of concurrent SSE
+subscribers without one OS thread per connection, and the routes need
+no changes - the stream already yields pre-serialized frames.
+
+For HTTP/2 (multiple dashboard streams multiplexed over one client
+connection, fast reconnects), bridge to ASGI and run under hypercorn:
+
+    # pip install asgiref hypercorn
+    # asgi_app = asgiref.wsgi.WsgiToAsgi(app)
+    hypercorn --bind :5000 web.wsgi:asgi_app
+
+Neither server is a package dependency; install whichever the
+deployment needs.
+"""
+
+from pathlib import Path
+
+from web.app import create_app
+
+_DATA_FILE = Path(__file__).parent.parent / 'data' / 'sample_sensor_data.csv'
+
+app = create_app(str(_DATA_FILE))